@@ -2,79 +2,28 @@
 """
 Setup script for Website Cloner Pro.
 
-Installs the website_cloner package with all dependencies.
+Package metadata and dependencies live in pyproject.toml; this shim is
+kept so that legacy ``python setup.py ...`` invocations keep working.
 """
 
-from setuptools import setup, find_packages
+import compileall
 import os
 
-# Read the README for long description
-here = os.path.abspath(os.path.dirname(__file__))
-readme_path = os.path.join(here, 'README.md')
+from setuptools import setup
+from setuptools.command.install import install
 
-if os.path.exists(readme_path):
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        long_description = f.read()
-else:
-    long_description = 'A modern Python-based website cloning and UI extraction tool.'
 
-# Read requirements
-requirements_path = os.path.join(here, 'requirements.txt')
-install_requires = []
-if os.path.exists(requirements_path):
-    with open(requirements_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                install_requires.append(line)
+class InstallWithBytecode(install):
+    """Install command that also writes ``__pycache__`` for the package."""
 
-setup(
-    name='website-cloner',
-    version='2.0.0',
-    author='Website Cloner Team',
-    author_email='',
-    description='A modern Python-based website cloning and UI extraction tool',
-    long_description=long_description,
-    long_description_content_type='text/markdown',
-    url='https://github.com/hell-webcoder/cloner',
-    packages=find_packages(),
-    include_package_data=True,
-    package_data={
-        'website_cloner.web': ['templates/*.html', 'static/*.css'],
-    },
-    classifiers=[
-        'Development Status :: 4 - Beta',
-        'Environment :: Console',
-        'Environment :: Web Environment',
-        'Intended Audience :: Developers',
-        'License :: OSI Approved :: MIT License',
-        'Operating System :: OS Independent',
-        'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.8',
-        'Programming Language :: Python :: 3.9',
-        'Programming Language :: Python :: 3.10',
-        'Programming Language :: Python :: 3.11',
-        'Programming Language :: Python :: 3.12',
-        'Topic :: Internet :: WWW/HTTP :: Site Management',
-        'Topic :: Software Development :: Libraries :: Python Modules',
-    ],
-    python_requires='>=3.8',
-    install_requires=install_requires,
-    entry_points={
-        'console_scripts': [
-            'website-cloner=website_cloner.main:run',
-            'website-cloner-web=website_cloner.web.run:main',
-        ],
-    },
-    keywords=[
-        'website',
-        'cloner',
-        'scraper',
-        'crawler',
-        'offline',
-        'archive',
-        'backup',
-        'ui-extraction',
-        'screenshot',
-    ],
-)
+    def run(self):
+        super().run()
+        # Compile at the default optimization level: that is the .pyc a
+        # normal interpreter looks for on first import
+        compileall.compile_dir(
+            os.path.join(self.install_lib, 'website_cloner'),
+            quiet=1,
+        )
+
+
+setup(cmdclass={'install': InstallWithBytecode})
@@ -3,7 +3,30 @@ Website Cloner Pro - A modern Python-based website cloning tool.
 
 This package provides functionality to crawl websites, render JavaScript pages,
 download assets, extract UI components, and save them for offline viewing.
+
+Subpackages are imported lazily on first attribute access (PEP 562), so
+``import website_cloner`` stays free of side effects.
 """
 
+import importlib
+
 __version__ = "2.0.0"
 __author__ = "Website Cloner Team"
+
+_submodules = {"analyzer", "crawler", "utils", "web", "main"}
+
+
+def __getattr__(name):
+    """Import the submodule ``name`` on first access."""
+    if name not in _submodules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{name}", __name__)
+
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | _submodules)
@@ -1,56 +1,97 @@
 """
 Analyzer module for comprehensive website UI extraction.
 
-Contains components for analyzing screenshots, styles, components, 
+Contains components for analyzing screenshots, styles, components,
 colors, typography, accessibility, SEO, and more.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing this package does not pull in every analyzer and its
+dependencies up front.
 """
 
-from .screenshot import ScreenshotCapture, ScreenshotResult, VIEWPORT_PRESETS
-from .styles import StyleAnalyzer, StyleAnalysisResult, DesignTokens
-from .components import ComponentDetector, ComponentAnalysisResult, ComponentType
-from .colors import ColorExtractor, ColorPalette, Color
-from .typography import TypographyAnalyzer, TypographyAnalysisResult
-from .accessibility import AccessibilityChecker, AccessibilityResult, AccessibilityIssue
-from .seo import SEOExtractor, SEOAnalysisResult
-from .forms import FormAnalyzer, FormAnalysisResult, FormInfo
-from .performance import PerformanceAnalyzer, PerformanceResult
-from .ui_extractor import UIExtractor, UIExtractionResult
-
-__all__ = [
-    # Main extractor
-    "UIExtractor",
-    "UIExtractionResult",
-    # Screenshot
-    "ScreenshotCapture",
-    "ScreenshotResult",
-    "VIEWPORT_PRESETS",
-    # Styles
-    "StyleAnalyzer",
-    "StyleAnalysisResult",
-    "DesignTokens",
-    # Components
-    "ComponentDetector",
-    "ComponentAnalysisResult",
-    "ComponentType",
-    # Colors
-    "ColorExtractor",
-    "ColorPalette",
-    "Color",
-    # Typography
-    "TypographyAnalyzer",
-    "TypographyAnalysisResult",
-    # Accessibility
-    "AccessibilityChecker",
-    "AccessibilityResult",
-    "AccessibilityIssue",
-    # SEO
-    "SEOExtractor",
-    "SEOAnalysisResult",
-    # Forms
-    "FormAnalyzer",
-    "FormAnalysisResult",
-    "FormInfo",
-    # Performance
-    "PerformanceAnalyzer",
-    "PerformanceResult",
-]
+import importlib
+
+# Submodule -> public names it provides (same shape as lazy_loader.attach)
+_submod_attrs = {
+    "ui_extractor": ["UIExtractor", "UIExtractionResult"],
+    "screenshot": ["ScreenshotCapture", "ScreenshotResult", "VIEWPORT_PRESETS"],
+    "styles": ["StyleAnalyzer", "StyleAnalysisResult", "DesignTokens"],
+    "components": ["ComponentDetector", "ComponentAnalysisResult", "ComponentType"],
+    "colors": ["ColorExtractor", "ColorPalette", "Color"],
+    "typography": ["TypographyAnalyzer", "TypographyAnalysisResult"],
+    "accessibility": ["AccessibilityChecker", "AccessibilityResult", "AccessibilityIssue"],
+    "seo": ["SEOExtractor", "SEOAnalysisResult"],
+    "forms": ["FormAnalyzer", "FormAnalysisResult", "FormInfo"],
+    "performance": ["PerformanceAnalyzer", "PerformanceResult"],
+}
+
+# Public name -> relative submodule that defines it
+_lazy_map = {
+    name: f".{submod}"
+    for submod, names in _submod_attrs.items()
+    for name in names
+}
+
+__all__ = [name for names in _submod_attrs.values() for name in names]
+
+# Relative submodule -> ImportError it raised, so a missing dependency
+# is not re-imported on every attribute access
+_failed = {}
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    mod_name = _lazy_map.get(name)
+    if mod_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    err = _failed.get(mod_name)
+    if err is None:
+        try:
+            module = importlib.import_module(mod_name, __name__)
+        except ImportError as e:
+            _failed[mod_name] = err = e
+    if err is not None:
+        raise AttributeError(f"{name} unavailable: {err}") from err
+
+    value = getattr(module, name)
+
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def preload_all(parallel: bool = True) -> None:
+    """
+    Import every analyzer submodule and bind all public names.
+
+    For callers that need the whole package (e.g. ``import *``). With
+    ``parallel`` the submodules are imported from a thread pool so
+    their file lookups overlap. Submodules whose dependencies are
+    missing are skipped and remembered in ``_failed``.
+    """
+    def _load(mod_name):
+        if mod_name in _failed:
+            return
+        try:
+            importlib.import_module(mod_name, __name__)
+        except ImportError as e:
+            _failed[mod_name] = e
+
+    submods = [f".{submod}" for submod in _submod_attrs]
+    if parallel:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(submods))) as executor:
+            list(executor.map(_load, submods))
+    else:
+        for mod_name in submods:
+            _load(mod_name)
+
+    for name, mod_name in _lazy_map.items():
+        if mod_name not in _failed:
+            __getattr__(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_map))
@@ -0,0 +1,57 @@
+from .accessibility import AccessibilityChecker as AccessibilityChecker
+from .accessibility import AccessibilityIssue as AccessibilityIssue
+from .accessibility import AccessibilityResult as AccessibilityResult
+from .colors import Color as Color
+from .colors import ColorExtractor as ColorExtractor
+from .colors import ColorPalette as ColorPalette
+from .components import ComponentAnalysisResult as ComponentAnalysisResult
+from .components import ComponentDetector as ComponentDetector
+from .components import ComponentType as ComponentType
+from .forms import FormAnalysisResult as FormAnalysisResult
+from .forms import FormAnalyzer as FormAnalyzer
+from .forms import FormInfo as FormInfo
+from .performance import PerformanceAnalyzer as PerformanceAnalyzer
+from .performance import PerformanceResult as PerformanceResult
+from .screenshot import VIEWPORT_PRESETS as VIEWPORT_PRESETS
+from .screenshot import ScreenshotCapture as ScreenshotCapture
+from .screenshot import ScreenshotResult as ScreenshotResult
+from .seo import SEOAnalysisResult as SEOAnalysisResult
+from .seo import SEOExtractor as SEOExtractor
+from .styles import DesignTokens as DesignTokens
+from .styles import StyleAnalysisResult as StyleAnalysisResult
+from .styles import StyleAnalyzer as StyleAnalyzer
+from .typography import TypographyAnalysisResult as TypographyAnalysisResult
+from .typography import TypographyAnalyzer as TypographyAnalyzer
+from .ui_extractor import UIExtractionResult as UIExtractionResult
+from .ui_extractor import UIExtractor as UIExtractor
+
+def preload_all(parallel: bool = ...) -> None: ...
+
+__all__ = [
+    "UIExtractor",
+    "UIExtractionResult",
+    "ScreenshotCapture",
+    "ScreenshotResult",
+    "VIEWPORT_PRESETS",
+    "StyleAnalyzer",
+    "StyleAnalysisResult",
+    "DesignTokens",
+    "ComponentDetector",
+    "ComponentAnalysisResult",
+    "ComponentType",
+    "ColorExtractor",
+    "ColorPalette",
+    "Color",
+    "TypographyAnalyzer",
+    "TypographyAnalysisResult",
+    "AccessibilityChecker",
+    "AccessibilityResult",
+    "AccessibilityIssue",
+    "SEOExtractor",
+    "SEOAnalysisResult",
+    "FormAnalyzer",
+    "FormAnalysisResult",
+    "FormInfo",
+    "PerformanceAnalyzer",
+    "PerformanceResult",
+]
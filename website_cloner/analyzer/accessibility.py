@@ -4,13 +4,18 @@ Accessibility checker module for analyzing website accessibility.
 Checks for common accessibility issues and WCAG compliance.
 """
 
+import html as html_lib
+import os
 import re
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, Iterable, List, Set, Optional, Any
 from enum import Enum
 
 from bs4 import BeautifulSoup, Tag
 
+from ..utils.cache import ResultCache, content_key
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.log import get_logger
 
 
@@ -28,7 +33,7 @@ class WCAGLevel(Enum):
     AAA = "AAA"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AccessibilityIssue:
     """Represents an accessibility issue found."""
     rule_id: str
@@ -42,7 +47,7 @@ class AccessibilityIssue:
     count: int = 1
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AccessibilityResult:
     """Result of accessibility analysis."""
     issues: List[AccessibilityIssue] = field(default_factory=list)
@@ -55,6 +60,69 @@ class AccessibilityResult:
     summary: Dict[str, Any] = field(default_factory=dict)
 
 
+_HEADING_LEVELS = {f'h{i}': i for i in range(1, 7)}
+
+_GENERIC_LINK_TEXTS = frozenset({'click here', 'read more', 'learn more', 'here', 'more'})
+_SKIP_INPUT_TYPES = frozenset({'hidden', 'submit', 'button', 'reset'})
+_FOCUSABLE_TAGS = frozenset({'a', 'button', 'input', 'select', 'textarea'})
+_SKIP_LINK_INDICATORS = ('skip', 'main', 'content', 'navigation')
+
+_VALID_ARIA_ROLES = frozenset({
+    'alert', 'alertdialog', 'application', 'article', 'banner',
+    'button', 'cell', 'checkbox', 'columnheader', 'combobox',
+    'complementary', 'contentinfo', 'definition', 'dialog',
+    'directory', 'document', 'feed', 'figure', 'form', 'grid',
+    'gridcell', 'group', 'heading', 'img', 'link', 'list',
+    'listbox', 'listitem', 'log', 'main', 'marquee', 'math',
+    'menu', 'menubar', 'menuitem', 'menuitemcheckbox',
+    'menuitemradio', 'navigation', 'none', 'note', 'option',
+    'presentation', 'progressbar', 'radio', 'radiogroup',
+    'region', 'row', 'rowgroup', 'rowheader', 'scrollbar',
+    'search', 'searchbox', 'separator', 'slider', 'spinbutton',
+    'status', 'switch', 'tab', 'table', 'tablist', 'tabpanel',
+    'term', 'textbox', 'timer', 'toolbar', 'tooltip', 'tree',
+    'treegrid', 'treeitem'
+})
+
+# outline:none / outline:0 removes the focus indicator
+_OUTLINE_REMOVED_RE = re.compile(r'outline\s*:\s*(?:none|0)', re.IGNORECASE)
+_ZOOM_DISABLED_RE = re.compile(r'user-scalable\s*=\s*no|maximum-scale\s*=\s*1', re.IGNORECASE)
+_COLOR_STYLE_RE = re.compile(r'color:|background', re.IGNORECASE)
+
+
+def _severity_score(errors: int, warnings: int, infos: int) -> float:
+    """Score out of 100, weighting errors 5, warnings 2 and infos 1."""
+    total_penalty = errors * 5 + warnings * 2 + infos
+    return round(max(0, 100 - total_penalty), 1)
+
+
+def _element_snippet(elem: Tag, limit: int = 100) -> str:
+    """
+    Render the opening tag of ``elem`` for issue reports.
+    
+    Only the tag itself is formatted, so reporting a <form> or <table>
+    does not serialize its whole subtree just to keep 100 characters.
+    """
+    parts = [elem.name]
+    for key, value in elem.attrs.items():
+        if isinstance(value, list):
+            value = ' '.join(value)
+        parts.append(f'{key}="{html_lib.escape(str(value))}"')
+    return f"<{' '.join(parts)}>"[:limit]
+
+
+@dataclass
+class _PageElements:
+    """Elements of a document, collected in one pass for the checks."""
+    tags: Dict[str, List[Tag]] = field(default_factory=lambda: defaultdict(list))
+    form_controls: List[Tag] = field(default_factory=list)
+    headings: List[Any] = field(default_factory=list)  # (level, tag)
+    with_role: List[Tag] = field(default_factory=list)
+    aria_hidden: List[Tag] = field(default_factory=list)
+    with_style: List[Tag] = field(default_factory=list)
+    labelled_ids: Set[str] = field(default_factory=set)  # label "for" targets
+
+
 class AccessibilityChecker:
     """
     Checks web pages for accessibility issues.
@@ -63,9 +131,16 @@ class AccessibilityChecker:
     WCAG guideline violations.
     """
     
-    def __init__(self):
-        """Initialize the accessibility checker."""
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the accessibility checker.
+        
+        Args:
+            cache_size: Number of results kept for repeated identical
+                pages (0 disables caching)
+        """
         self.logger = get_logger("accessibility")
+        self._cache = ResultCache(cache_size)
     
     def check(self, html: str) -> AccessibilityResult:
         """
@@ -77,6 +152,37 @@ class AccessibilityChecker:
         Returns:
             AccessibilityResult with found issues
         """
+        key = content_key(html)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._check(html)
+            self._cache.put(key, result)
+        return result
+    
+    @classmethod
+    def check_many(
+        cls,
+        htmls: Iterable[str],
+        workers: Optional[int] = None
+    ) -> List[AccessibilityResult]:
+        """
+        Check several pages in parallel worker processes.
+        
+        Args:
+            htmls: HTML content of each page
+            workers: Number of processes (defaults to the CPU count)
+            
+        Returns:
+            AccessibilityResult for each page, in input order
+        """
+        # Imported here: multiprocessing is only needed for batches
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(_check_one_html, htmls, chunksize=8))
+    
+    def _check(self, html: str) -> AccessibilityResult:
+        """Run all checks on ``html`` without consulting the cache."""
         result = AccessibilityResult()
         
         try:
@@ -84,52 +190,101 @@ class AccessibilityChecker:
         except Exception:
             soup = BeautifulSoup(html, 'html.parser')
         
-        # Run all checks
-        self._check_images(soup, result)
-        self._check_links(soup, result)
-        self._check_forms(soup, result)
-        self._check_headings(soup, result)
-        self._check_language(soup, result)
-        self._check_landmarks(soup, result)
-        self._check_tables(soup, result)
-        self._check_color_contrast_indicators(soup, result)
-        self._check_focus_indicators(soup, result)
-        self._check_aria(soup, result)
-        self._check_skip_links(soup, result)
-        self._check_document_structure(soup, result)
-        
-        # Calculate counts
+        # Walk the tree once, then run all checks on the collected elements
+        elements = self._collect_elements(soup)
+        tags = elements.tags
+        
+        # Element-specific checks only run when the page has those elements;
+        # the rest also report absences and always run
+        if tags['img']:
+            self._check_images(tags['img'], result)
+        if tags['a']:
+            self._check_links(tags['a'], result)
+        if elements.form_controls or tags['form']:
+            self._check_forms(elements.form_controls, tags['form'], elements.labelled_ids, result)
+        self._check_headings(elements.headings, result)
+        self._check_language(tags['html'], result)
+        self._check_landmarks(tags, elements.with_role, result)
+        if tags['table']:
+            self._check_tables(tags['table'], result)
+        if elements.with_style:
+            self._check_color_contrast_indicators(elements.with_style, result)
+        if tags['style']:
+            self._check_focus_indicators(tags['style'], result)
+        if elements.with_role or elements.aria_hidden:
+            self._check_aria(elements.with_role, elements.aria_hidden, result)
+        self._check_skip_links(tags['a'], result)
+        self._check_document_structure(tags['title'], tags['meta'], result)
+        
+        # Calculate counts in a single pass over the issues
+        level_counts = Counter()
+        wcag_errors = Counter()
+        for issue in result.issues:
+            level_counts[issue.level] += 1
+            if issue.level is IssueLevel.ERROR:
+                wcag_errors[issue.wcag_level] += 1
+        
         result.issue_count = len(result.issues)
-        result.errors_count = sum(
-            1 for i in result.issues if i.level == IssueLevel.ERROR
-        )
-        result.warnings_count = sum(
-            1 for i in result.issues if i.level == IssueLevel.WARNING
-        )
+        result.errors_count = level_counts[IssueLevel.ERROR]
+        result.warnings_count = level_counts[IssueLevel.WARNING]
         
         # Calculate score
-        result.score = self._calculate_score(result)
+        result.score = self._calculate_score(result, level_counts)
         
         # Determine WCAG level
-        result.wcag_level = self._determine_wcag_level(result)
+        result.wcag_level = self._determine_wcag_level(wcag_errors)
         
         # Generate summary
-        result.summary = self._generate_summary(soup, result)
+        result.summary = self._generate_summary(tags, result)
         
         return result
     
+    def _collect_elements(self, soup: BeautifulSoup) -> _PageElements:
+        """Bucket every tag of the document in a single traversal."""
+        elements = _PageElements()
+        tags = elements.tags
+        
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            
+            name = node.name
+            attrs = node.attrs
+            tags[name].append(node)
+            
+            if name in ('input', 'select', 'textarea'):
+                elements.form_controls.append(node)
+            elif name == 'label':
+                label_for = attrs.get('for')
+                if label_for:
+                    elements.labelled_ids.add(label_for)
+            elif name in _HEADING_LEVELS:
+                elements.headings.append((_HEADING_LEVELS[name], node))
+            
+            if 'role' in attrs:
+                elements.with_role.append(node)
+            if attrs.get('aria-hidden') == 'true':
+                elements.aria_hidden.append(node)
+            if attrs.get('style'):
+                elements.with_style.append(node)
+        
+        # Headings were historically grouped by level (all h1, then h2 ...);
+        # a stable sort keeps that order
+        elements.headings.sort(key=lambda h: h[0])
+        
+        return elements
+    
     def _check_images(
         self,
-        soup: BeautifulSoup,
+        images: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check images for accessibility issues."""
-        images = soup.find_all('img')
         images_without_alt = 0
         images_with_empty_alt = 0
         
         for img in images:
-            alt = img.get('alt')
+            alt = img.attrs.get('alt')
             
             if alt is None:
                 images_without_alt += 1
@@ -139,7 +294,7 @@ class AccessibilityChecker:
                     level=IssueLevel.ERROR,
                     wcag_criteria="1.1.1",
                     wcag_level=WCAGLevel.A,
-                    element=str(img)[:100],
+                    element=_element_snippet(img),
                     selector=self._build_selector(img),
                     recommendation="Add alt attribute with descriptive text"
                 ))
@@ -153,48 +308,45 @@ class AccessibilityChecker:
     
     def _check_links(
         self,
-        soup: BeautifulSoup,
+        links: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check links for accessibility issues."""
-        links = soup.find_all('a')
-        
         for link in links:
-            href = link.get('href', '')
+            attrs = link.attrs
             text = link.get_text(strip=True)
-            aria_label = link.get('aria-label', '')
+            aria_label = attrs.get('aria-label', '')
             
             # Check for empty links
             if not text and not aria_label:
                 img = link.find('img')
-                if not img or not img.get('alt'):
+                if not img or not img.attrs.get('alt'):
                     result.issues.append(AccessibilityIssue(
                         rule_id="link-empty",
                         description="Link has no accessible text",
                         level=IssueLevel.ERROR,
                         wcag_criteria="2.4.4",
                         wcag_level=WCAGLevel.A,
-                        element=str(link)[:100],
+                        element=_element_snippet(link),
                         selector=self._build_selector(link),
                         recommendation="Add link text or aria-label"
                     ))
             
             # Check for generic link text
-            generic_texts = {'click here', 'read more', 'learn more', 'here', 'more'}
-            if text.lower() in generic_texts:
+            if text.lower() in _GENERIC_LINK_TEXTS:
                 result.issues.append(AccessibilityIssue(
                     rule_id="link-generic-text",
                     description=f"Link has generic text: '{text}'",
                     level=IssueLevel.WARNING,
                     wcag_criteria="2.4.4",
                     wcag_level=WCAGLevel.A,
-                    element=str(link)[:100],
+                    element=_element_snippet(link),
                     recommendation="Use descriptive link text"
                 ))
             
             # Check for target="_blank" without rel
-            if link.get('target') == '_blank':
-                rel = link.get('rel', [])
+            if attrs.get('target') == '_blank':
+                rel = attrs.get('rel', [])
                 if isinstance(rel, str):
                     rel = rel.split()
                 if 'noopener' not in rel and 'noreferrer' not in rel:
@@ -204,36 +356,36 @@ class AccessibilityChecker:
                         level=IssueLevel.WARNING,
                         wcag_criteria="3.2.5",
                         wcag_level=WCAGLevel.AAA,
-                        element=str(link)[:100],
+                        element=_element_snippet(link),
                         recommendation="Add rel='noopener noreferrer' for security"
                     ))
     
     def _check_forms(
         self,
-        soup: BeautifulSoup,
+        inputs: List[Tag],
+        forms: List[Tag],
+        labelled_ids: Set[str],
         result: AccessibilityResult
     ) -> None:
         """Check forms for accessibility issues."""
         # Check inputs for labels
-        inputs = soup.find_all(['input', 'select', 'textarea'])
-        
         for input_elem in inputs:
-            input_type = input_elem.get('type', 'text')
+            attrs = input_elem.attrs
+            input_type = attrs.get('type', 'text')
             
             # Skip hidden and button inputs
-            if input_type in {'hidden', 'submit', 'button', 'reset'}:
+            if input_type in _SKIP_INPUT_TYPES:
                 continue
             
-            input_id = input_elem.get('id')
-            aria_label = input_elem.get('aria-label')
-            aria_labelledby = input_elem.get('aria-labelledby')
+            input_id = attrs.get('id')
+            aria_label = attrs.get('aria-label')
+            aria_labelledby = attrs.get('aria-labelledby')
             
             has_label = False
             
             # Check for associated label
             if input_id:
-                label = soup.find('label', attrs={'for': input_id})
-                if label:
+                if input_id in labelled_ids:
                     has_label = True
             
             # Check for aria-label or aria-labelledby
@@ -252,40 +404,34 @@ class AccessibilityChecker:
                     level=IssueLevel.ERROR,
                     wcag_criteria="1.3.1",
                     wcag_level=WCAGLevel.A,
-                    element=str(input_elem)[:100],
+                    element=_element_snippet(input_elem),
                     selector=self._build_selector(input_elem),
                     recommendation="Add a <label> element with 'for' attribute or aria-label"
                 ))
         
         # Check for form error handling
-        forms = soup.find_all('form')
         for form in forms:
-            aria_describedby = form.get('aria-describedby')
+            aria_describedby = form.attrs.get('aria-describedby')
             if not aria_describedby:
                 # Check if there's error handling mechanism
-                error_elements = form.find_all(class_=lambda c: c and 'error' in c.lower() if c else False)
-                if not error_elements:
+                error_element = form.select_one('[class*="error" i]')
+                if error_element is None:
                     result.issues.append(AccessibilityIssue(
                         rule_id="form-no-error-handling",
                         description="Form may lack accessible error handling",
                         level=IssueLevel.INFO,
                         wcag_criteria="3.3.1",
                         wcag_level=WCAGLevel.A,
-                        element=str(form)[:100],
+                        element=_element_snippet(form),
                         recommendation="Add accessible error messages linked via aria-describedby"
                     ))
     
     def _check_headings(
         self,
-        soup: BeautifulSoup,
+        headings: List[Any],
         result: AccessibilityResult
     ) -> None:
         """Check heading structure for accessibility."""
-        headings = []
-        for i in range(1, 7):
-            for h in soup.find_all(f'h{i}'):
-                headings.append((i, h))
-        
         if not headings:
             result.issues.append(AccessibilityIssue(
                 rule_id="heading-none",
@@ -297,8 +443,39 @@ class AccessibilityChecker:
             ))
             return
         
+        # One pass: count h1s, find skipped levels and empty headings.
+        # Issues are appended afterwards to keep the reported order.
+        h1_count = 0
+        skipped = []
+        empty = []
+        prev_level = 0
+        for level, h in headings:
+            if level == 1:
+                h1_count += 1
+            elif level > prev_level + 1 and prev_level > 0:
+                skipped.append(AccessibilityIssue(
+                    rule_id="heading-skip-level",
+                    description=f"Heading level skipped from h{prev_level} to h{level}",
+                    level=IssueLevel.WARNING,
+                    wcag_criteria="1.3.1",
+                    wcag_level=WCAGLevel.A,
+                    element=_element_snippet(h),
+                    recommendation="Don't skip heading levels"
+                ))
+            prev_level = level
+            
+            if not h.get_text(strip=True):
+                empty.append(AccessibilityIssue(
+                    rule_id="heading-empty",
+                    description=f"Empty h{level} heading",
+                    level=IssueLevel.ERROR,
+                    wcag_criteria="1.3.1",
+                    wcag_level=WCAGLevel.A,
+                    element=_element_snippet(h),
+                    recommendation="Add content to heading or remove it"
+                ))
+        
         # Check for h1
-        h1_count = len([h for h in headings if h[0] == 1])
         if h1_count == 0:
             result.issues.append(AccessibilityIssue(
                 rule_id="heading-no-h1",
@@ -318,43 +495,17 @@ class AccessibilityChecker:
                 recommendation="Consider having only one h1 per page"
             ))
         
-        # Check heading order
-        prev_level = 0
-        for level, h in headings:
-            if level > prev_level + 1 and prev_level > 0:
-                result.issues.append(AccessibilityIssue(
-                    rule_id="heading-skip-level",
-                    description=f"Heading level skipped from h{prev_level} to h{level}",
-                    level=IssueLevel.WARNING,
-                    wcag_criteria="1.3.1",
-                    wcag_level=WCAGLevel.A,
-                    element=str(h)[:100],
-                    recommendation="Don't skip heading levels"
-                ))
-            prev_level = level
-        
-        # Check for empty headings
-        for level, h in headings:
-            if not h.get_text(strip=True):
-                result.issues.append(AccessibilityIssue(
-                    rule_id="heading-empty",
-                    description=f"Empty h{level} heading",
-                    level=IssueLevel.ERROR,
-                    wcag_criteria="1.3.1",
-                    wcag_level=WCAGLevel.A,
-                    element=str(h)[:100],
-                    recommendation="Add content to heading or remove it"
-                ))
+        result.issues.extend(skipped)
+        result.issues.extend(empty)
     
     def _check_language(
         self,
-        soup: BeautifulSoup,
+        html_tags: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check for language attributes."""
-        html = soup.find('html')
-        
-        if html:
+        if html_tags:
+            html = html_tags[0]
             lang = html.get('lang')
             if not lang:
                 result.issues.append(AccessibilityIssue(
@@ -370,14 +521,16 @@ class AccessibilityChecker:
     
     def _check_landmarks(
         self,
-        soup: BeautifulSoup,
+        tags: Dict[str, List[Tag]],
+        with_role: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check for ARIA landmarks."""
-        has_main = bool(soup.find('main') or soup.find(role='main'))
-        has_nav = bool(soup.find('nav') or soup.find(role='navigation'))
-        has_banner = bool(soup.find('header') or soup.find(role='banner'))
-        has_contentinfo = bool(soup.find('footer') or soup.find(role='contentinfo'))
+        roles = {elem.attrs.get('role') for elem in with_role}
+        has_main = bool(tags['main'] or 'main' in roles)
+        has_nav = bool(tags['nav'] or 'navigation' in roles)
+        has_banner = bool(tags['header'] or 'banner' in roles)
+        has_contentinfo = bool(tags['footer'] or 'contentinfo' in roles)
         
         if not has_main:
             result.issues.append(AccessibilityIssue(
@@ -390,49 +543,51 @@ class AccessibilityChecker:
             ))
         
         # Check for multiple nav without labels
-        navs = soup.find_all('nav')
+        navs = tags['nav']
         if len(navs) > 1:
             for nav in navs:
-                if not nav.get('aria-label') and not nav.get('aria-labelledby'):
+                if not nav.attrs.get('aria-label') and not nav.attrs.get('aria-labelledby'):
                     result.issues.append(AccessibilityIssue(
                         rule_id="landmark-nav-no-label",
                         description="Multiple nav elements without unique labels",
                         level=IssueLevel.WARNING,
                         wcag_criteria="1.3.1",
                         wcag_level=WCAGLevel.A,
-                        element=str(nav)[:100],
+                        element=_element_snippet(nav),
                         recommendation="Add aria-label to distinguish nav elements"
                     ))
                     break
     
     def _check_tables(
         self,
-        soup: BeautifulSoup,
+        tables: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check tables for accessibility."""
-        tables = soup.find_all('table')
-        
         for table in tables:
+            # Collect caption and header cells in one walk of the table
+            cells = table.find_all(['caption', 'th'])
+            th_cells = [cell for cell in cells if cell.name == 'th']
+            has_caption = len(th_cells) < len(cells)
+            
             # Check for caption or summary
-            caption = table.find('caption')
-            summary = table.get('summary')
-            aria_label = table.get('aria-label')
-            aria_labelledby = table.get('aria-labelledby')
+            attrs = table.attrs
+            summary = attrs.get('summary')
+            aria_label = attrs.get('aria-label')
+            aria_labelledby = attrs.get('aria-labelledby')
             
-            if not caption and not summary and not aria_label and not aria_labelledby:
+            if not has_caption and not summary and not aria_label and not aria_labelledby:
                 result.issues.append(AccessibilityIssue(
                     rule_id="table-no-caption",
                     description="Table has no caption or accessible name",
                     level=IssueLevel.WARNING,
                     wcag_criteria="1.3.1",
                     wcag_level=WCAGLevel.A,
-                    element=str(table)[:100],
+                    element=_element_snippet(table),
                     recommendation="Add <caption> or aria-label"
                 ))
             
             # Check for header cells
-            th_cells = table.find_all('th')
             if not th_cells:
                 result.issues.append(AccessibilityIssue(
                     rule_id="table-no-headers",
@@ -440,40 +595,36 @@ class AccessibilityChecker:
                     level=IssueLevel.ERROR,
                     wcag_criteria="1.3.1",
                     wcag_level=WCAGLevel.A,
-                    element=str(table)[:100],
+                    element=_element_snippet(table),
                     recommendation="Add <th> elements for header cells"
                 ))
             
-            # Check th scope
-            for th in th_cells:
-                scope = th.get('scope')
-                if not scope:
-                    result.issues.append(AccessibilityIssue(
-                        rule_id="table-th-no-scope",
-                        description="Table header cell missing scope attribute",
-                        level=IssueLevel.WARNING,
-                        wcag_criteria="1.3.1",
-                        wcag_level=WCAGLevel.A,
-                        element=str(th)[:100],
-                        recommendation="Add scope='col' or scope='row'"
-                    ))
-                    break
+            # Check th scope (reported once per table)
+            bad_th = next((th for th in th_cells if not th.attrs.get('scope')), None)
+            if bad_th is not None:
+                result.issues.append(AccessibilityIssue(
+                    rule_id="table-th-no-scope",
+                    description="Table header cell missing scope attribute",
+                    level=IssueLevel.WARNING,
+                    wcag_criteria="1.3.1",
+                    wcag_level=WCAGLevel.A,
+                    element=_element_snippet(bad_th),
+                    recommendation="Add scope='col' or scope='row'"
+                ))
     
     def _check_color_contrast_indicators(
         self,
-        soup: BeautifulSoup,
+        with_style: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check for color contrast issues (heuristic)."""
         # This is a simplified check - full contrast checking requires computed styles
         
         # Check for color-only information indicators
-        elements_with_color = soup.find_all(
-            style=lambda s: s and ('color:' in s.lower() or 'background' in s.lower()) if s else False
-        )
+        uses_color = any(_COLOR_STYLE_RE.search(elem['style']) for elem in with_style)
         
         # This is informational only
-        if len(elements_with_color) > 0:
+        if uses_color:
             result.issues.append(AccessibilityIssue(
                 rule_id="color-contrast-check",
                 description="Page uses color styling - verify color contrast meets WCAG requirements",
@@ -485,19 +636,14 @@ class AccessibilityChecker:
     
     def _check_focus_indicators(
         self,
-        soup: BeautifulSoup,
+        styles: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check for focus indicator issues."""
         # Check for outline:none or outline:0 which removes focus indicators
-        style_content = ""
+        style_content = "".join(style.string for style in styles if style.string)
         
-        for style in soup.find_all('style'):
-            if style.string:
-                style_content += style.string
-        
-        style_content_lower = style_content.lower()
-        if 'outline:none' in style_content_lower or 'outline: none' in style_content_lower or 'outline:0' in style_content_lower:
+        if _OUTLINE_REMOVED_RE.search(style_content):
             result.issues.append(AccessibilityIssue(
                 rule_id="focus-outline-removed",
                 description="Focus outline may be removed in styles",
@@ -509,72 +655,52 @@ class AccessibilityChecker:
     
     def _check_aria(
         self,
-        soup: BeautifulSoup,
+        elements_with_role: List[Tag],
+        hidden_elements: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check ARIA usage."""
         # Check for invalid ARIA roles
-        valid_roles = {
-            'alert', 'alertdialog', 'application', 'article', 'banner',
-            'button', 'cell', 'checkbox', 'columnheader', 'combobox',
-            'complementary', 'contentinfo', 'definition', 'dialog',
-            'directory', 'document', 'feed', 'figure', 'form', 'grid',
-            'gridcell', 'group', 'heading', 'img', 'link', 'list',
-            'listbox', 'listitem', 'log', 'main', 'marquee', 'math',
-            'menu', 'menubar', 'menuitem', 'menuitemcheckbox',
-            'menuitemradio', 'navigation', 'none', 'note', 'option',
-            'presentation', 'progressbar', 'radio', 'radiogroup',
-            'region', 'row', 'rowgroup', 'rowheader', 'scrollbar',
-            'search', 'searchbox', 'separator', 'slider', 'spinbutton',
-            'status', 'switch', 'tab', 'table', 'tablist', 'tabpanel',
-            'term', 'textbox', 'timer', 'toolbar', 'tooltip', 'tree',
-            'treegrid', 'treeitem'
-        }
-        
-        elements_with_role = soup.find_all(role=True)
         for elem in elements_with_role:
-            role = elem.get('role', '').lower()
-            if role and role not in valid_roles:
+            role = elem.attrs.get('role', '').lower()
+            if role and role not in _VALID_ARIA_ROLES:
                 result.issues.append(AccessibilityIssue(
                     rule_id="aria-invalid-role",
                     description=f"Invalid ARIA role: '{role}'",
                     level=IssueLevel.ERROR,
                     wcag_criteria="4.1.2",
                     wcag_level=WCAGLevel.A,
-                    element=str(elem)[:100],
+                    element=_element_snippet(elem),
                     recommendation="Use a valid ARIA role"
                 ))
         
         # Check for aria-hidden on focusable elements
-        hidden_elements = soup.find_all(attrs={'aria-hidden': 'true'})
         for elem in hidden_elements:
-            if elem.name in {'a', 'button', 'input', 'select', 'textarea'}:
+            if elem.name in _FOCUSABLE_TAGS:
                 result.issues.append(AccessibilityIssue(
                     rule_id="aria-hidden-focusable",
                     description="aria-hidden='true' on focusable element",
                     level=IssueLevel.ERROR,
                     wcag_criteria="4.1.2",
                     wcag_level=WCAGLevel.A,
-                    element=str(elem)[:100],
+                    element=_element_snippet(elem),
                     recommendation="Don't hide focusable elements from assistive technology"
                 ))
     
     def _check_skip_links(
         self,
-        soup: BeautifulSoup,
+        links: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check for skip links."""
-        first_links = soup.find_all('a')[:5]
+        first_links = links[:5]
         has_skip_link = False
         
-        skip_indicators = ['skip', 'main', 'content', 'navigation']
-        
         for link in first_links:
-            href = link.get('href', '')
+            href = link.attrs.get('href', '')
             text = link.get_text(strip=True).lower()
             
-            if href.startswith('#') and any(ind in text for ind in skip_indicators):
+            if href.startswith('#') and any(ind in text for ind in _SKIP_LINK_INDICATORS):
                 has_skip_link = True
                 break
         
@@ -590,12 +716,13 @@ class AccessibilityChecker:
     
     def _check_document_structure(
         self,
-        soup: BeautifulSoup,
+        titles: List[Tag],
+        metas: List[Tag],
         result: AccessibilityResult
     ) -> None:
         """Check overall document structure."""
         # Check for title
-        title = soup.find('title')
+        title = titles[0] if titles else None
         if not title or not title.get_text(strip=True):
             result.issues.append(AccessibilityIssue(
                 rule_id="document-no-title",
@@ -609,10 +736,10 @@ class AccessibilityChecker:
             result.passed_checks.append("Page has title")
         
         # Check for viewport meta
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = next((m for m in metas if m.attrs.get('name') == 'viewport'), None)
         if viewport:
             content = viewport.get('content', '')
-            if 'user-scalable=no' in content.lower() or 'maximum-scale=1' in content:
+            if _ZOOM_DISABLED_RE.search(content):
                 result.issues.append(AccessibilityIssue(
                     rule_id="viewport-zoom-disabled",
                     description="Page prevents zooming",
@@ -624,15 +751,16 @@ class AccessibilityChecker:
     
     def _build_selector(self, elem: Tag) -> str:
         """Build a CSS selector for an element."""
-        if not isinstance(elem, Tag):
-            return ""
-        
+        # Callers pass tags from the collected buckets, so read the
+        # attribute dict directly
         tag = elem.name
+        attrs = elem.attrs
         
-        if elem.get('id'):
-            return f"{tag}#{elem['id']}"
+        elem_id = attrs.get('id')
+        if elem_id:
+            return f"{tag}#{elem_id}"
         
-        classes = elem.get('class', [])
+        classes = attrs.get('class', [])
         if isinstance(classes, str):
             classes = classes.split()
         
@@ -641,43 +769,33 @@ class AccessibilityChecker:
         
         return tag
     
-    def _calculate_score(self, result: AccessibilityResult) -> float:
+    def _calculate_score(
+        self,
+        result: AccessibilityResult,
+        level_counts: Counter
+    ) -> float:
         """Calculate accessibility score."""
         if not result.issues:
             return 100.0
         
-        # Weight by severity
-        error_penalty = result.errors_count * 5
-        warning_penalty = result.warnings_count * 2
-        info_penalty = sum(1 for i in result.issues if i.level == IssueLevel.INFO)
-        
-        total_penalty = error_penalty + warning_penalty + info_penalty
-        score = max(0, 100 - total_penalty)
-        
-        return round(score, 1)
+        return _severity_score(
+            level_counts[IssueLevel.ERROR],
+            level_counts[IssueLevel.WARNING],
+            level_counts[IssueLevel.INFO],
+        )
     
-    def _determine_wcag_level(self, result: AccessibilityResult) -> str:
-        """Determine highest WCAG compliance level."""
-        level_a_errors = [
-            i for i in result.issues
-            if i.wcag_level == WCAGLevel.A and i.level == IssueLevel.ERROR
-        ]
-        
-        level_aa_errors = [
-            i for i in result.issues
-            if i.wcag_level == WCAGLevel.AA and i.level == IssueLevel.ERROR
-        ]
-        
-        if level_a_errors:
+    def _determine_wcag_level(self, wcag_errors: Counter) -> str:
+        """Determine highest WCAG compliance level from error counts per level."""
+        if wcag_errors[WCAGLevel.A]:
             return "Below Level A"
-        elif level_aa_errors:
+        elif wcag_errors[WCAGLevel.AA]:
             return "Level A"
         else:
             return "Level AA (tentative)"
     
     def _generate_summary(
         self,
-        soup: BeautifulSoup,
+        tags: Dict[str, List[Tag]],
         result: AccessibilityResult
     ) -> Dict[str, Any]:
         """Generate a summary of accessibility analysis."""
@@ -688,17 +806,22 @@ class AccessibilityChecker:
             'passed_checks': len(result.passed_checks),
             'score': result.score,
             'wcag_level': result.wcag_level,
-            'has_images': len(soup.find_all('img')),
-            'has_links': len(soup.find_all('a')),
-            'has_forms': len(soup.find_all('form')),
-            'has_tables': len(soup.find_all('table')),
+            'has_images': len(tags['img']),
+            'has_links': len(tags['a']),
+            'has_forms': len(tags['form']),
+            'has_tables': len(tags['table']),
             'semantic_elements': {
-                'header': bool(soup.find('header')),
-                'main': bool(soup.find('main')),
-                'footer': bool(soup.find('footer')),
-                'nav': bool(soup.find('nav')),
-                'article': bool(soup.find('article')),
-                'section': bool(soup.find('section')),
-                'aside': bool(soup.find('aside')),
+                'header': bool(tags['header']),
+                'main': bool(tags['main']),
+                'footer': bool(tags['footer']),
+                'nav': bool(tags['nav']),
+                'article': bool(tags['article']),
+                'section': bool(tags['section']),
+                'aside': bool(tags['aside']),
             }
         }
+
+
+def _check_one_html(html: str) -> AccessibilityResult:
+    """Worker for AccessibilityChecker.check_many (module level to be picklable)."""
+    return AccessibilityChecker(cache_size=0).check(html)
@@ -5,13 +5,18 @@ Extracts colors from CSS, styles, and images to build a comprehensive color pale
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Tuple
-from collections import Counter
+from functools import lru_cache
+from typing import Any, DefaultDict, Dict, FrozenSet, List, Set, Optional, Tuple
+from collections import Counter, defaultdict
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
+from ..utils.cache import ResultCache, content_key
+from ..utils.patterns import trie_pattern
 from ..utils.log import get_logger
+from ..utils.markup import scan_html, reject_namespaced
 
 
 @dataclass
@@ -39,6 +44,380 @@ class ColorPalette:
     dominant_color: Optional[Color] = None
 
 
+# Color extraction patterns
+# Only the lengths _normalize_hex accepts; (?!\w) equals the old trailing
+# \b here and, unlike a {3,8} range, leaves nothing to backtrack over
+_HEX_PATTERN = re.compile(r'#([0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{3})(?!\w)')
+_RGB_PATTERN = re.compile(r'rgba?\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)(?:\s*,\s*[\d.]+)?\s*\)')
+_HSL_PATTERN = re.compile(r'hsla?\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%(?:\s*,\s*[\d.]+)?\s*\)')
+
+# CSS declaration patterns
+_CSS_COMMENT_PATTERN = re.compile(r'/\*.*?(?:\*/|\Z)', re.DOTALL)
+# The lookbehind only lets a name start at the beginning of a word; without
+# it a long run of word characters with no ':' (e.g. a data URI) is retried
+# from every offset, which is quadratic
+_CSS_PROP_PATTERN = re.compile(r'(?<![\w-])([\w-]+)\s*:\s*([^;{}]+)')
+
+# Color property names for context detection
+_BACKGROUND_PROPS = frozenset({'background', 'background-color', 'bg'})
+_TEXT_PROPS = frozenset({'color', 'text-color'})
+_BORDER_PROPS = frozenset({'border', 'border-color', 'outline', 'outline-color'})
+
+# Named colors (subset of CSS named colors)
+_NAMED_COLORS = {
+    'black': '#000000', 'white': '#ffffff', 'red': '#ff0000',
+    'green': '#008000', 'blue': '#0000ff', 'yellow': '#ffff00',
+    'cyan': '#00ffff', 'magenta': '#ff00ff', 'gray': '#808080',
+    'grey': '#808080', 'silver': '#c0c0c0', 'maroon': '#800000',
+    'olive': '#808000', 'lime': '#00ff00', 'aqua': '#00ffff',
+    'teal': '#008080', 'navy': '#000080', 'fuchsia': '#ff00ff',
+    'purple': '#800080', 'orange': '#ffa500', 'pink': '#ffc0cb',
+    'brown': '#a52a2a', 'gold': '#ffd700', 'coral': '#ff7f50',
+    'crimson': '#dc143c', 'darkblue': '#00008b', 'darkgreen': '#006400',
+    'darkred': '#8b0000', 'lightblue': '#add8e6', 'lightgreen': '#90ee90',
+    'lightgray': '#d3d3d3', 'lightgrey': '#d3d3d3', 'darkgray': '#a9a9a9',
+    'darkgrey': '#a9a9a9', 'transparent': None, 'inherit': None,
+    'currentcolor': None, 'initial': None, 'unset': None,
+}
+
+
+_NAMED_COLOR_RE = re.compile(
+    r'\b(' + trie_pattern([
+        name for name, hex_val in _NAMED_COLORS.items() if hex_val is not None
+    ]) + r')\b',
+    re.IGNORECASE,
+)
+
+# Non-ASCII characters that re.IGNORECASE matches against the ASCII
+# letters used in color names
+_NAMED_COLOR_FOLDS = str.maketrans({
+    '\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k',
+})
+
+# Report order of named colors (declaration order of _NAMED_COLORS)
+_NAMED_COLOR_ORDER = {name: i for i, name in enumerate(_NAMED_COLORS)}
+
+# Any letter, including the non-ASCII ones IGNORECASE folds onto names
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Every color syntax in one alternation so a value is scanned once. Group
+# 1 is hex, 2-4 rgb, 5-7 hsl and 8 the color name, so lastindex tells
+# which syntax matched. Only the named part is case-insensitive,
+# as in the individual patterns.
+_RGB_LAST_GROUP = 1 + _RGB_PATTERN.groups
+_HSL_LAST_GROUP = _RGB_LAST_GROUP + _HSL_PATTERN.groups
+_ANY_COLOR_RE = re.compile(
+    '|'.join((
+        _HEX_PATTERN.pattern,
+        _RGB_PATTERN.pattern,
+        _HSL_PATTERN.pattern,
+        f'(?i:{_NAMED_COLOR_RE.pattern})',
+    ))
+)
+
+
+# The conversions below are pure functions of small, highly repetitive
+# inputs (the same CSS values recur across a stylesheet), so they are
+# memoized at module level and shared by all extractors.
+
+@lru_cache(maxsize=4096)
+def _colors_in_value(value: str) -> Tuple[str, ...]:
+    """Extract all color values from a CSS value string as hex."""
+    # Every color syntax needs a '#' or a letter; this skips values such
+    # as '0', '1.5' or '100%' without running the full scan
+    if '#' not in value and not _LETTER_RE.search(value):
+        return ()
+    
+    hex_colors = []
+    rgb_colors = []
+    hsl_colors = []
+    found = set()
+    
+    for match in _ANY_COLOR_RE.finditer(value):
+        last = match.lastindex
+        if last == 1:
+            # hex
+            normalized = _normalize_hex(match.group(1))
+            if normalized:
+                hex_colors.append(normalized)
+        elif last == _RGB_LAST_GROUP:
+            # rgb/rgba
+            r, g, b = int(match.group(2)), int(match.group(3)), int(match.group(4))
+            rgb_colors.append(_rgb_to_hex(r, g, b))
+        elif last == _HSL_LAST_GROUP:
+            # hsl/hsla
+            h, s, l = int(match.group(5)), int(match.group(6)), int(match.group(7))
+            hsl_colors.append(_rgb_to_hex(*_hsl_to_rgb(h, s, l)))
+        else:
+            # named color; each name counts once per value
+            name = match.group(last)
+            if not name.isascii():
+                name = name.translate(_NAMED_COLOR_FOLDS)
+            found.add(name.lower())
+    
+    # Report in the same order as one scan per syntax would
+    colors = hex_colors + rgb_colors + hsl_colors
+    for name in sorted(found, key=_NAMED_COLOR_ORDER.__getitem__):
+        colors.append(_NAMED_COLORS[name])
+    
+    # Interned so every occurrence of a color shares one key object
+    return tuple(map(sys.intern, colors))
+
+
+def _record_colors(
+    value: str,
+    context: str,
+    usage_counts: Counter,
+    color_contexts: DefaultDict[str, Set[str]],
+) -> None:
+    """Count the colors in a CSS value and note the context they appear in."""
+    colors = _colors_in_value(value)
+    if not colors:
+        return
+    usage_counts.update(colors)
+    for hex_color in colors:
+        color_contexts[hex_color].add(context)
+
+
+def _strip_css_comments(css: str) -> str:
+    """Remove CSS comments; an unterminated comment runs to the end."""
+    if '/*' not in css:
+        return css
+    # Replace with a space so tokens on either side stay apart
+    return _CSS_COMMENT_PATTERN.sub(' ', css)
+
+
+@lru_cache(maxsize=1024)
+def _property_context(name: str) -> str:
+    """Classify a lower-cased CSS property name by where its color is used."""
+    # Substring tests on purpose: longhands such as border-top-color or
+    # background-image share the context of their shorthand
+    if any(p in name for p in _BACKGROUND_PROPS):
+        return 'background'
+    if any(p in name for p in _TEXT_PROPS):
+        return 'text'
+    if any(p in name for p in _BORDER_PROPS):
+        return 'border'
+    return 'other'
+
+
+def _scan_css(css: str) -> Tuple[Tuple[str, int, FrozenSet[str]], ...]:
+    """
+    Summarize the colors used in a stylesheet.
+    
+    Pages of one site usually embed the same stylesheets, so extractors
+    keep the summary per stylesheet digest and merge it themselves.
+    
+    Returns:
+        (hex, usage count, contexts) per color, in order of first use
+    """
+    usage_counts: Counter = Counter()
+    color_contexts: DefaultDict[str, Set[str]] = defaultdict(set)
+    
+    # Commented-out rules are not part of the palette
+    css = _strip_css_comments(css)
+    
+    # One scan over all declarations; custom properties are also counted
+    # as variables, and those are recorded first
+    variables: List[str] = []
+    declarations: List[Tuple[str, str]] = []
+    for match in _CSS_PROP_PATTERN.finditer(css):
+        name = match.group(1).strip().lower()
+        value = match.group(2).strip()
+        
+        if name.startswith('--'):
+            variables.append(value)
+        
+        # Determine context
+        declarations.append((_property_context(name), value))
+    
+    for value in variables:
+        _record_colors(value, 'variable', usage_counts, color_contexts)
+    for context, value in declarations:
+        _record_colors(value, context, usage_counts, color_contexts)
+    
+    return tuple(
+        (hex_color, count, frozenset(color_contexts[hex_color]))
+        for hex_color, count in usage_counts.items()
+    )
+
+
+@lru_cache(maxsize=4096)
+def _normalize_hex(hex_val: str) -> Optional[str]:
+    """Normalize hex color to 6-digit format."""
+    hex_val = hex_val.lower()
+    
+    if len(hex_val) == 3:
+        # Expand 3-digit hex
+        hex_val = ''.join(c * 2 for c in hex_val)
+    elif len(hex_val) == 8:
+        # Strip alpha channel
+        hex_val = hex_val[:6]
+    elif len(hex_val) != 6:
+        return None
+    
+    try:
+        # Validate hex
+        bytes.fromhex(hex_val)
+    except ValueError:
+        return None
+    return f"#{hex_val}"
+
+
+def _rgb_to_hex(r: int, g: int, b: int) -> str:
+    """Convert RGB to hex color."""
+    r = max(0, min(255, r))
+    g = max(0, min(255, g))
+    b = max(0, min(255, b))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+@lru_cache(maxsize=4096)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Convert hex color to RGB."""
+    hex_val = hex_color.lstrip('#')
+    try:
+        # One C-level decode instead of three int(..., 16) calls
+        r, g, b = bytes.fromhex(hex_val[:6])
+    except ValueError:
+        # Short or odd-length input: keep the old per-channel parsing
+        return tuple(int(hex_val[i:i+2], 16) for i in (0, 2, 4))
+    return (r, g, b)
+
+
+def _hue_to_rgb(p: float, q: float, t: float) -> float:
+    """Compute one RGB channel from the HSL helper values p, q and hue t."""
+    if t < 0:
+        t += 1
+    if t > 1:
+        t -= 1
+    if t < 1/6:
+        return p + (q - p) * 6 * t
+    if t < 1/2:
+        return q
+    if t < 2/3:
+        return p + (q - p) * (2/3 - t) * 6
+    return p
+
+
+@lru_cache(maxsize=4096)
+def _hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
+    """Convert HSL to RGB."""
+    h = h / 360
+    s = s / 100
+    l = l / 100
+    
+    if s == 0:
+        r = g = b = l
+    else:
+        q = l * (1 + s) if l < 0.5 else l + s - l * s
+        p = 2 * l - q
+        r = _hue_to_rgb(p, q, h + 1/3)
+        g = _hue_to_rgb(p, q, h)
+        b = _hue_to_rgb(p, q, h - 1/3)
+    
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+@lru_cache(maxsize=4096)
+def _rgb_to_hsl(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """Convert RGB to HSL."""
+    r, g, b = r / 255, g / 255, b / 255
+    
+    max_c = max(r, g, b)
+    min_c = min(r, g, b)
+    l = (max_c + min_c) / 2
+    
+    if max_c == min_c:
+        h = s = 0
+    else:
+        d = max_c - min_c
+        s = d / (2 - max_c - min_c) if l > 0.5 else d / (max_c + min_c)
+        
+        if max_c == r:
+            h = (g - b) / d + (6 if g < b else 0)
+        elif max_c == g:
+            h = (b - r) / d + 2
+        else:
+            h = (r - g) / d + 4
+        
+        h /= 6
+    
+    return (int(h * 360), int(s * 100), int(l * 100))
+
+
+def _srgb_channel_to_linear(c: int) -> float:
+    """Linearize one 8-bit sRGB channel value."""
+    c = c / 255
+    return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+
+# All 256 channel values, so luminance needs no pow() per call
+_SRGB_TO_LINEAR = tuple(_srgb_channel_to_linear(c) for c in range(256))
+
+
+@lru_cache(maxsize=1024)
+def _relative_luminance(hex_color: str) -> float:
+    """WCAG relative luminance of a hex color."""
+    r, g, b = _hex_to_rgb(hex_color)
+    return (
+        0.2126 * _SRGB_TO_LINEAR[r]
+        + 0.7152 * _SRGB_TO_LINEAR[g]
+        + 0.0722 * _SRGB_TO_LINEAR[b]
+    )
+
+
+class _StyleScanner:
+    """
+    lxml parser target collecting what _collect_styles_from_soup does.
+    
+    It sees the same parser events BeautifulSoup builds its tree from,
+    so it finds the same style attributes and <style> strings, without
+    any tree being built.
+    """
+    
+    def __init__(self):
+        self.inline_styles: List[str] = []
+        self.style_blocks: List[str] = []
+        # Text of the open style tag, or None once it has anything but
+        # text (BeautifulSoup's .string is then None)
+        self._style_text: Optional[List[str]] = None
+        self._in_style = False
+    
+    def start(self, tag: str, attrib: Dict[str, str], nsmap: Any = None) -> None:
+        reject_namespaced(tag, attrib)
+        self._style_text = None
+        
+        if tag == 'style':
+            self._in_style = True
+            self._style_text = []
+        style = attrib.get('style')
+        if style is not None:
+            self.inline_styles.append(style)
+    
+    def end(self, tag: str) -> None:
+        if tag == 'style' and self._in_style:
+            self._end_style()
+    
+    def _end_style(self) -> None:
+        if self._style_text:
+            self.style_blocks.append(''.join(self._style_text))
+        self._in_style = False
+        self._style_text = None
+    
+    def data(self, data: str) -> None:
+        if self._style_text is not None:
+            self._style_text.append(data)
+    
+    def comment(self, text: str) -> None:
+        self._style_text = None
+    
+    def close(self) -> Tuple[List[str], List[str]]:
+        if self._in_style:
+            self._end_style()
+        return self.inline_styles, self.style_blocks
+
+
 class ColorExtractor:
     """
     Extracts and analyzes colors from web pages.
@@ -48,41 +427,31 @@ class ColorExtractor:
     """
     
     # Color extraction patterns
-    HEX_PATTERN = re.compile(r'#([0-9a-fA-F]{3,8})\b')
-    RGB_PATTERN = re.compile(r'rgba?\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)(?:\s*,\s*[\d.]+)?\s*\)')
-    HSL_PATTERN = re.compile(r'hsla?\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%(?:\s*,\s*[\d.]+)?\s*\)')
+    HEX_PATTERN = _HEX_PATTERN
+    RGB_PATTERN = _RGB_PATTERN
+    HSL_PATTERN = _HSL_PATTERN
     
     # Named colors (subset of CSS named colors)
-    NAMED_COLORS = {
-        'black': '#000000', 'white': '#ffffff', 'red': '#ff0000',
-        'green': '#008000', 'blue': '#0000ff', 'yellow': '#ffff00',
-        'cyan': '#00ffff', 'magenta': '#ff00ff', 'gray': '#808080',
-        'grey': '#808080', 'silver': '#c0c0c0', 'maroon': '#800000',
-        'olive': '#808000', 'lime': '#00ff00', 'aqua': '#00ffff',
-        'teal': '#008080', 'navy': '#000080', 'fuchsia': '#ff00ff',
-        'purple': '#800080', 'orange': '#ffa500', 'pink': '#ffc0cb',
-        'brown': '#a52a2a', 'gold': '#ffd700', 'coral': '#ff7f50',
-        'crimson': '#dc143c', 'darkblue': '#00008b', 'darkgreen': '#006400',
-        'darkred': '#8b0000', 'lightblue': '#add8e6', 'lightgreen': '#90ee90',
-        'lightgray': '#d3d3d3', 'lightgrey': '#d3d3d3', 'darkgray': '#a9a9a9',
-        'darkgrey': '#a9a9a9', 'transparent': None, 'inherit': None,
-        'currentcolor': None, 'initial': None, 'unset': None,
-    }
+    NAMED_COLORS = _NAMED_COLORS
     
     # Color property names for context detection
-    BACKGROUND_PROPS = {'background', 'background-color', 'bg'}
-    TEXT_PROPS = {'color', 'text-color'}
-    BORDER_PROPS = {'border', 'border-color', 'outline', 'outline-color'}
+    BACKGROUND_PROPS = _BACKGROUND_PROPS
+    TEXT_PROPS = _TEXT_PROPS
+    BORDER_PROPS = _BORDER_PROPS
     
-    def __init__(self):
-        """Initialize the color extractor."""
+    def __init__(self, cache_size: int = 128, css_cache_size: int = 128):
+        """
+        Initialize the color extractor.
+        
+        Args:
+            cache_size: Number of palettes kept for repeated identical
+                pages (0 disables caching)
+            css_cache_size: Number of stylesheet color summaries kept for
+                stylesheets shared between pages (0 disables caching)
+        """
         self.logger = get_logger("colors")
-        # Pre-compile named color patterns
-        self._named_color_patterns = {
-            name: re.compile(r'\b' + re.escape(name) + r'\b', re.IGNORECASE)
-            for name, hex_val in self.NAMED_COLORS.items()
-            if hex_val is not None
-        }
+        self._cache = ResultCache(cache_size)
+        self._css_cache = ResultCache(css_cache_size)
     
     def extract_colors(self, html: str, css_content: str = "") -> ColorPalette:
         """
@@ -95,34 +464,41 @@ class ColorExtractor:
         Returns:
             ColorPalette with extracted colors
         """
+        key = content_key(html, css_content)
+        palette = self._cache.get(key)
+        if palette is None:
+            palette = self._extract_colors(html, css_content)
+            self._cache.put(key, palette)
+        return palette
+    
+    def _extract_colors(self, html: str, css_content: str) -> ColorPalette:
+        """Build the palette for ``html`` without consulting the cache."""
         palette = ColorPalette()
-        color_contexts: Dict[str, List[str]] = {}  # hex -> contexts
+        usage_counts: Counter = Counter()  # hex -> occurrences
+        color_contexts: DefaultDict[str, Set[str]] = defaultdict(set)  # hex -> contexts
         
         # Parse HTML
-        try:
-            soup = BeautifulSoup(html, 'lxml')
-        except Exception:
-            soup = BeautifulSoup(html, 'html.parser')
+        inline_styles, style_blocks = self._collect_styles(html)
         
-        # Extract from inline styles
-        for elem in soup.find_all(style=True):
-            style = elem.get('style', '')
-            self._extract_from_style(style, color_contexts)
+        # Extract from inline styles in one batch; joining on ';' yields
+        # exactly the declarations of the individual attributes, in order
+        if inline_styles:
+            inline_styles = [_strip_css_comments(style) for style in inline_styles]
+            self._extract_from_style(';'.join(inline_styles), usage_counts, color_contexts)
         
         # Extract from style tags
-        for style_tag in soup.find_all('style'):
-            if style_tag.string:
-                self._extract_from_css(style_tag.string, color_contexts)
+        for css in style_blocks:
+            self._extract_from_css(css, usage_counts, color_contexts)
         
         # Extract from additional CSS
         if css_content:
-            self._extract_from_css(css_content, color_contexts)
+            self._extract_from_css(css_content, usage_counts, color_contexts)
         
         # Build color objects
         all_colors = []
-        for hex_color, contexts in color_contexts.items():
+        for hex_color, count in usage_counts.items():
             if hex_color and hex_color != 'transparent':
-                color = self._create_color(hex_color, contexts)
+                color = self._create_color(hex_color, count, color_contexts[hex_color])
                 if color:
                     all_colors.append(color)
         
@@ -139,10 +515,47 @@ class ColorExtractor:
         
         return palette
     
+    def _collect_styles(self, html: str) -> Tuple[List[str], List[str]]:
+        """
+        Collect inline style attributes and <style> contents in document order.
+        
+        Returns:
+            Tuple of (inline style strings, non-empty style tag contents)
+        """
+        # Read off lxml's parser events, so no tree is built; a tree is
+        # only built for markup the scan rejects
+        try:
+            return scan_html(html, _StyleScanner())
+        except Exception:
+            return self._collect_styles_from_soup(html)
+    
+    def _collect_styles_from_soup(self, html: str) -> Tuple[List[str], List[str]]:
+        """BeautifulSoup fallback for _collect_styles."""
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+        except Exception:
+            soup = BeautifulSoup(html, 'html.parser')
+        
+        inline_styles: List[str] = []
+        style_blocks: List[str] = []
+        
+        # One walk collects both kinds of style source
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            if node.name == 'style' and node.string:
+                style_blocks.append(node.string)
+            style = node.attrs.get('style')
+            if style is not None:
+                inline_styles.append(style)
+        
+        return inline_styles, style_blocks
+    
     def _extract_from_style(
         self,
         style: str,
-        color_contexts: Dict[str, List[str]]
+        usage_counts: Counter,
+        color_contexts: DefaultDict[str, Set[str]]
     ) -> None:
         """Extract colors from an inline style string."""
         # Parse style properties
@@ -153,178 +566,59 @@ class ColorExtractor:
                 value = value.strip()
                 
                 # Determine context
-                context = 'other'
-                if any(p in name for p in self.BACKGROUND_PROPS):
-                    context = 'background'
-                elif any(p in name for p in self.TEXT_PROPS):
-                    context = 'text'
-                elif any(p in name for p in self.BORDER_PROPS):
-                    context = 'border'
+                context = _property_context(name)
                 
                 # Extract colors from value
-                colors = self._extract_colors_from_value(value)
-                for hex_color in colors:
-                    if hex_color not in color_contexts:
-                        color_contexts[hex_color] = []
-                    color_contexts[hex_color].append(context)
+                _record_colors(value, context, usage_counts, color_contexts)
     
     def _extract_from_css(
         self,
         css: str,
-        color_contexts: Dict[str, List[str]]
+        usage_counts: Counter,
+        color_contexts: DefaultDict[str, Set[str]]
     ) -> None:
         """Extract colors from CSS content."""
-        # Extract from CSS variable definitions
-        var_pattern = re.compile(r'--[\w-]+\s*:\s*([^;]+)')
-        for match in var_pattern.finditer(css):
-            value = match.group(1)
-            colors = self._extract_colors_from_value(value)
-            for hex_color in colors:
-                if hex_color not in color_contexts:
-                    color_contexts[hex_color] = []
-                color_contexts[hex_color].append('variable')
-        
-        # Extract from property values
-        prop_pattern = re.compile(r'([\w-]+)\s*:\s*([^;{}]+)')
-        for match in prop_pattern.finditer(css):
-            name = match.group(1).strip().lower()
-            value = match.group(2).strip()
-            
-            # Determine context
-            context = 'other'
-            if any(p in name for p in self.BACKGROUND_PROPS):
-                context = 'background'
-            elif any(p in name for p in self.TEXT_PROPS):
-                context = 'text'
-            elif any(p in name for p in self.BORDER_PROPS):
-                context = 'border'
-            
-            colors = self._extract_colors_from_value(value)
-            for hex_color in colors:
-                if hex_color not in color_contexts:
-                    color_contexts[hex_color] = []
-                color_contexts[hex_color].append(context)
+        # Keyed by digest, so the cache holds summaries, not stylesheets
+        key = content_key(css)
+        summary = self._css_cache.get(key)
+        if summary is None:
+            summary = _scan_css(css)
+            self._css_cache.put(key, summary)
+        for hex_color, count, contexts in summary:
+            usage_counts[hex_color] += count
+            color_contexts[hex_color].update(contexts)
     
     def _extract_colors_from_value(self, value: str) -> List[str]:
         """Extract all color values from a CSS value string."""
-        colors = []
-        
-        # Check hex colors
-        for match in self.HEX_PATTERN.finditer(value):
-            hex_val = match.group(1)
-            normalized = self._normalize_hex(hex_val)
-            if normalized:
-                colors.append(normalized)
-        
-        # Check rgb/rgba colors
-        for match in self.RGB_PATTERN.finditer(value):
-            r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            hex_color = self._rgb_to_hex(r, g, b)
-            colors.append(hex_color)
-        
-        # Check hsl/hsla colors
-        for match in self.HSL_PATTERN.finditer(value):
-            h, s, l = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            rgb = self._hsl_to_rgb(h, s, l)
-            hex_color = self._rgb_to_hex(*rgb)
-            colors.append(hex_color)
-        
-        # Check named colors using pre-compiled patterns
-        for name, pattern in self._named_color_patterns.items():
-            if pattern.search(value):
-                colors.append(self.NAMED_COLORS[name])
-        
-        return colors
+        return list(_colors_in_value(value))
     
     def _normalize_hex(self, hex_val: str) -> Optional[str]:
         """Normalize hex color to 6-digit format."""
-        hex_val = hex_val.lower()
-        
-        if len(hex_val) == 3:
-            # Expand 3-digit hex
-            hex_val = ''.join(c * 2 for c in hex_val)
-        elif len(hex_val) == 8:
-            # Strip alpha channel
-            hex_val = hex_val[:6]
-        elif len(hex_val) != 6:
-            return None
-        
-        try:
-            # Validate hex
-            int(hex_val, 16)
-            return f"#{hex_val}"
-        except ValueError:
-            return None
+        return _normalize_hex(hex_val)
     
     def _rgb_to_hex(self, r: int, g: int, b: int) -> str:
         """Convert RGB to hex color."""
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _rgb_to_hex(r, g, b)
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB."""
-        hex_val = hex_color.lstrip('#')
-        return tuple(int(hex_val[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
     
     def _hsl_to_rgb(self, h: int, s: int, l: int) -> Tuple[int, int, int]:
         """Convert HSL to RGB."""
-        h = h / 360
-        s = s / 100
-        l = l / 100
-        
-        if s == 0:
-            r = g = b = l
-        else:
-            def hue_to_rgb(p, q, t):
-                if t < 0:
-                    t += 1
-                if t > 1:
-                    t -= 1
-                if t < 1/6:
-                    return p + (q - p) * 6 * t
-                if t < 1/2:
-                    return q
-                if t < 2/3:
-                    return p + (q - p) * (2/3 - t) * 6
-                return p
-            
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            r = hue_to_rgb(p, q, h + 1/3)
-            g = hue_to_rgb(p, q, h)
-            b = hue_to_rgb(p, q, h - 1/3)
-        
-        return (int(r * 255), int(g * 255), int(b * 255))
+        return _hsl_to_rgb(h, s, l)
     
     def _rgb_to_hsl(self, r: int, g: int, b: int) -> Tuple[int, int, int]:
         """Convert RGB to HSL."""
-        r, g, b = r / 255, g / 255, b / 255
-        
-        max_c = max(r, g, b)
-        min_c = min(r, g, b)
-        l = (max_c + min_c) / 2
-        
-        if max_c == min_c:
-            h = s = 0
-        else:
-            d = max_c - min_c
-            s = d / (2 - max_c - min_c) if l > 0.5 else d / (max_c + min_c)
-            
-            if max_c == r:
-                h = (g - b) / d + (6 if g < b else 0)
-            elif max_c == g:
-                h = (b - r) / d + 2
-            else:
-                h = (r - g) / d + 4
-            
-            h /= 6
-        
-        return (int(h * 360), int(s * 100), int(l * 100))
+        return _rgb_to_hsl(r, g, b)
     
-    def _create_color(self, hex_color: str, contexts: List[str]) -> Optional[Color]:
-        """Create a Color object from hex value and contexts."""
+    def _create_color(
+        self,
+        hex_color: str,
+        usage_count: int,
+        contexts: Set[str]
+    ) -> Optional[Color]:
+        """Create a Color object from hex value, usage count and contexts."""
         try:
             rgb = self._hex_to_rgb(hex_color)
             hsl = self._rgb_to_hsl(*rgb)
@@ -334,8 +628,8 @@ class ColorExtractor:
                 hex=hex_color,
                 rgb=rgb,
                 hsl=hsl,
-                usage_count=len(contexts),
-                contexts=list(set(contexts))
+                usage_count=usage_count,
+                contexts=list(contexts)
             )
         except Exception:
             return None
@@ -379,17 +673,8 @@ class ColorExtractor:
         Returns:
             Contrast ratio (1.0 to 21.0)
         """
-        def get_luminance(hex_color: str) -> float:
-            rgb = self._hex_to_rgb(hex_color)
-            rgb_normalized = [c / 255 for c in rgb]
-            rgb_linear = [
-                c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-                for c in rgb_normalized
-            ]
-            return 0.2126 * rgb_linear[0] + 0.7152 * rgb_linear[1] + 0.0722 * rgb_linear[2]
-        
-        l1 = get_luminance(color1)
-        l2 = get_luminance(color2)
+        l1 = _relative_luminance(color1)
+        l2 = _relative_luminance(color2)
         
         lighter = max(l1, l2)
         darker = min(l1, l2)
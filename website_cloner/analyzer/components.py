@@ -5,12 +5,20 @@ Detects common UI patterns like navigation, forms, cards, buttons, etc.
 """
 
 import re
+import sys
+import threading
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any, Tuple
+from collections import Counter
+from typing import Dict, List, Set, Optional, Any, Tuple, Union
 from enum import Enum
 
 from bs4 import BeautifulSoup, Tag
+from bs4.builder import HTMLTreeBuilder
 
+from ..utils.cache import ResultCache, content_key
+from ..utils.patterns import trie_pattern
+from ..utils.markup import LazyField, UNREAD, scan_html, reject_namespaced
 from ..utils.log import get_logger
 
 
@@ -51,18 +59,101 @@ class ComponentType(Enum):
     UNKNOWN = "unknown"
 
 
+def _parse_html(html: str) -> BeautifulSoup:
+    """Parse HTML with lxml, falling back to the built-in parser."""
+    try:
+        return BeautifulSoup(html, 'lxml')
+    except Exception:
+        return BeautifulSoup(html, 'html.parser')
+
+
+class _ElementSource:
+    """
+    The page a set of components was detected in.
+    
+    Elements are addressed by their position among the page's tags in
+    document order. The page is only parsed again when a component's
+    markup or text is first requested, and the tree is then kept for
+    the other components of the same page. Copies of a result share
+    the source, so it is never duplicated by the result cache.
+    
+    A source made from an already parsed page uses that tree directly,
+    and parses the page again with the same builder if it has to.
+    """
+    
+    def __init__(self, html: str, soup: Optional[BeautifulSoup] = None):
+        self.html = html
+        self._builder = None
+        self._elements: Optional[List[Tag]] = None
+        self._lock = threading.Lock()
+        if soup is not None:
+            self._builder = type(soup.builder)
+            self._elements = [
+                elem for elem in soup.descendants if isinstance(elem, Tag)
+            ]
+    
+    def element(self, position: int) -> Tag:
+        """Return the tag at ``position`` in document order."""
+        with self._lock:
+            if self._elements is None:
+                if self._builder is None:
+                    soup = _parse_html(self.html)
+                else:
+                    soup = BeautifulSoup(self.html, builder=self._builder)
+                self._elements = [
+                    elem for elem in soup.descendants if isinstance(elem, Tag)
+                ]
+        return self._elements[position]
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_ElementSource":
+        return self
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The lock is recreated and the page parsed again after unpickling
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_elements'] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _truncated_markup(component: "DetectedComponent") -> str:
+    """A detected component's markup, limited to 1000 characters."""
+    inner_html = str(component._source.element(component._position))
+    if len(inner_html) > 1000:
+        inner_html = inner_html[:1000] + "..."
+    return inner_html
+
+
+def _truncated_text(component: "DetectedComponent") -> str:
+    """A detected component's stripped text, limited to 500 characters."""
+    text = component._source.element(component._position).get_text(strip=True)
+    if len(text) > 500:
+        text = text[:500] + "..."
+    return text
+
+
 @dataclass
 class DetectedComponent:
-    """Represents a detected UI component."""
+    """
+    Represents a detected UI component.
+    
+    For detected components, inner_html and text_content are computed
+    from the page on first access, so callers that never read them don't
+    pay for serializing each component's subtree.
+    """
     component_type: ComponentType
     selector: str
     tag_name: str
     class_names: List[str]
     id_attr: Optional[str]
-    inner_html: str
+    inner_html: str = LazyField(_truncated_markup)
     attributes: Dict[str, str]
     children_count: int
-    text_content: str
+    text_content: str = LazyField(_truncated_text)
     confidence: float  # 0.0 to 1.0
 
 
@@ -76,6 +167,455 @@ class ComponentAnalysisResult:
     css_framework: Optional[str] = None
 
 
+# Semantic HTML tags that are components by themselves
+_TAG_COMPONENT_TYPES = {
+    'nav': ComponentType.NAVIGATION,
+    'header': ComponentType.HEADER,
+    'footer': ComponentType.FOOTER,
+    'aside': ComponentType.SIDEBAR,
+    'form': ComponentType.FORM,
+    'table': ComponentType.TABLE,
+    'button': ComponentType.BUTTON,
+}
+
+# Tags that make up the semantic score of a page
+_SEMANTIC_TAGS = ('header', 'footer', 'main', 'nav', 'article', 'section', 'aside')
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# A pattern that is just a word or hyphenated words between \b anchors
+_LITERAL_PATTERN_RE = re.compile(r'\\b(\w+(?:-\w+)*)\\b')
+_WORD_RE = re.compile(r'\w+')
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+_CASE_FOLDS = str.maketrans({
+    '\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k',
+})
+
+
+def _compile_alternation(patterns: List[str]) -> "re.Pattern":
+    """Compile patterns into one case-insensitive regex matching any of them."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
+
+def _fold(word: str) -> str:
+    """Case-fold a word the way re.IGNORECASE compares it to ASCII."""
+    if not word.isascii():
+        word = word.translate(_CASE_FOLDS)
+    return word.lower()
+
+
+def _build_literal_index(
+    pattern_groups: List[List[str]]
+) -> Optional[Tuple[Dict[str, int], int, "re.Pattern", List[Tuple[int, "re.Pattern"]]]]:
+    """
+    Map every literal pattern to the index of the first group listing it.
+    
+    Patterns that are not plain ASCII word-boundary literals are kept
+    per group as regexes, to be searched only where no literal decides.
+    
+    Returns:
+        (index, most words in one literal, pattern finding the words a
+        literal can start with, (group index, regex) pairs for the other
+        patterns in group order), or None if no pattern is a literal
+    """
+    index: Dict[str, int] = {}
+    max_words = 1
+    residual: List[Tuple[int, "re.Pattern"]] = []
+    for group_index, patterns in enumerate(pattern_groups):
+        others = []
+        for pattern in patterns:
+            match = _LITERAL_PATTERN_RE.fullmatch(pattern)
+            if not match or not match.group(1).isascii():
+                others.append(pattern)
+                continue
+            literal = _fold(match.group(1))
+            index.setdefault(literal, group_index)
+            max_words = max(max_words, literal.count('-') + 1)
+        if others:
+            residual.append((group_index, _compile_alternation(others)))
+    
+    if not index:
+        return None
+    
+    first_words = sorted({literal.split('-')[0] for literal in index})
+    triggers = re.compile(r'\b(?:' + trie_pattern(first_words) + r')\b')
+    return index, max_words, triggers, residual
+
+
+def _first_literal_matches(
+    texts: List[str],
+    index: Dict[str, int],
+    max_words: int,
+    triggers: "re.Pattern",
+    residual: List[Tuple[int, "re.Pattern"]]
+) -> List[Optional[int]]:
+    """
+    For each text, find the lowest group index whose patterns match it,
+    with the same result as searching each group's patterns.
+    
+    All texts are scanned as one buffer; a separator that is neither a
+    word character nor '-' keeps literals from spanning two texts.
+    """
+    # Folding is per character and keeps the length, so offsets into the
+    # folded buffer are offsets into the joined texts
+    buffer = _fold('\x1f'.join(texts))
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    
+    results: List[Optional[int]] = [None] * len(texts)
+    
+    # A \b-anchored literal starts and ends on word boundaries, so it is a
+    # run of whole words joined by single hyphens. Only words some literal
+    # starts with are visited; the scan for them runs in the regex engine.
+    for word in triggers.finditer(buffer):
+        key = word.group()
+        end = word.end()
+        word_count = 1
+        best = None
+        while True:
+            found = index.get(key)
+            if found is not None and (best is None or found < best):
+                best = found
+            if word_count >= max_words or buffer[end:end + 1] != '-':
+                break
+            next_word = _WORD_RE.match(buffer, end + 1)
+            if next_word is None:
+                break
+            key += '-' + next_word.group()
+            end = next_word.end()
+            word_count += 1
+        
+        if best is not None:
+            text_index = bisect_right(starts, word.start()) - 1
+            current = results[text_index]
+            if current is None or best < current:
+                results[text_index] = best
+    
+    # The remaining patterns can only improve on a text's result through
+    # a group listed before the one its literals found
+    if residual:
+        for text_index, text in enumerate(texts):
+            current = results[text_index]
+            for group_index, pattern in residual:
+                if current is not None and group_index >= current:
+                    break
+                if pattern.search(text):
+                    results[text_index] = group_index
+                    break
+    
+    return results
+
+
+# Class patterns for component detection
+_COMPONENT_PATTERNS = {
+    ComponentType.NAVIGATION: [
+        r'\bnav\b', r'\bnavbar\b', r'\bnavigation\b', r'\bmenu\b',
+        r'\btop-bar\b', r'\bheader-nav\b', r'\bmain-nav\b'
+    ],
+    ComponentType.HEADER: [
+        r'\bheader\b', r'\bsite-header\b', r'\bpage-header\b',
+        r'\bmasthead\b', r'\btop-header\b'
+    ],
+    ComponentType.FOOTER: [
+        r'\bfooter\b', r'\bsite-footer\b', r'\bpage-footer\b',
+        r'\bbottom\b'
+    ],
+    ComponentType.SIDEBAR: [
+        r'\bsidebar\b', r'\bside-nav\b', r'\bside-menu\b',
+        r'\baside\b', r'\bdrawer\b'
+    ],
+    ComponentType.HERO: [
+        r'\bhero\b', r'\bjumbotron\b', r'\bbanner\b', r'\bsplash\b',
+        r'\bintro\b', r'\blead\b'
+    ],
+    ComponentType.CARD: [
+        r'\bcard\b', r'\bpanel\b', r'\btile\b', r'\bbox\b',
+        r'\bitem\b', r'\bpost\b'
+    ],
+    ComponentType.BUTTON: [
+        r'\bbtn\b', r'\bbutton\b', r'\bcta\b'
+    ],
+    ComponentType.FORM: [
+        r'\bform\b', r'\bform-group\b', r'\binput-group\b'
+    ],
+    ComponentType.MODAL: [
+        r'\bmodal\b', r'\bdialog\b', r'\bpopup\b', r'\boverlay\b',
+        r'\blightbox\b'
+    ],
+    ComponentType.DROPDOWN: [
+        r'\bdropdown\b', r'\bselect\b', r'\bpopover\b', r'\bmenu\b'
+    ],
+    ComponentType.TABS: [
+        r'\btab\b', r'\btabs\b', r'\btab-content\b', r'\btab-pane\b'
+    ],
+    ComponentType.ACCORDION: [
+        r'\baccordion\b', r'\bcollapse\b', r'\bexpandable\b',
+        r'\bfaq\b'
+    ],
+    ComponentType.CAROUSEL: [
+        r'\bcarousel\b', r'\bslider\b', r'\bslideshow\b',
+        r'\bswiper\b', r'\bslick\b', r'\bowl\b'
+    ],
+    ComponentType.TABLE: [
+        r'\btable\b', r'\bdata-table\b', r'\bgrid-table\b'
+    ],
+    ComponentType.LIST: [
+        r'\blist\b', r'\blist-group\b', r'\bitems\b'
+    ],
+    ComponentType.GRID: [
+        r'\bgrid\b', r'\brow\b', r'\bcol\b', r'\bcolumn\b',
+        r'\blayout\b'
+    ],
+    ComponentType.IMAGE_GALLERY: [
+        r'\bgallery\b', r'\bgrid-gallery\b', r'\bimage-grid\b',
+        r'\bportfolio\b'
+    ],
+    ComponentType.BREADCRUMB: [
+        r'\bbreadcrumb\b', r'\bcrumbs\b'
+    ],
+    ComponentType.PAGINATION: [
+        r'\bpagination\b', r'\bpager\b', r'\bpage-nav\b'
+    ],
+    ComponentType.ALERT: [
+        r'\balert\b', r'\bnotification\b', r'\bnotice\b',
+        r'\bmessage\b', r'\btoast\b'
+    ],
+    ComponentType.BADGE: [
+        r'\bbadge\b', r'\blabel\b', r'\btag\b', r'\bchip\b'
+    ],
+    ComponentType.PROGRESS: [
+        r'\bprogress\b', r'\bloading\b', r'\bspinner\b'
+    ],
+    ComponentType.AVATAR: [
+        r'\bavatar\b', r'\bprofile-pic\b', r'\buser-image\b'
+    ],
+    ComponentType.SEARCH: [
+        r'\bsearch\b', r'\bsearch-form\b', r'\bsearchbox\b'
+    ],
+    ComponentType.SOCIAL: [
+        r'\bsocial\b', r'\bshare\b', r'\bfollow\b'
+    ],
+    ComponentType.TESTIMONIAL: [
+        r'\btestimonial\b', r'\bquote\b', r'\breview\b'
+    ],
+    ComponentType.PRICING: [
+        r'\bpricing\b', r'\bprice\b', r'\bplan\b'
+    ],
+    ComponentType.FEATURE: [
+        r'\bfeature\b', r'\bbenefits\b', r'\bservices\b'
+    ],
+}
+
+# Framework detection patterns
+_FRAMEWORK_PATTERNS = {
+    'bootstrap': [r'\bbootstrap\b', r'\bbs-', r'\bbtn-primary\b'],
+    'tailwind': [r'\btailwind\b', r'\btext-\w+-\d+\b', r'\bbg-\w+-\d+\b'],
+    'material-ui': [r'\bMui', r'\bmaterial\b', r'\bmat-'],
+    'bulma': [r'\bbulma\b', r'\bis-\w+\b'],
+    'foundation': [r'\bfoundation\b', r'\brow\s+column\b'],
+    'semantic-ui': [r'\bsemantic\b', r'\bui\s+\w+\b'],
+    'chakra': [r'\bchakra\b', r'\bcss-\w+\b'],
+    'ant-design': [r'\bant-', r'\bantd\b'],
+}
+
+# JS Framework detection
+_JS_FRAMEWORK_PATTERNS = {
+    'react': [r'\b__react', r'\breact-', r'\bdata-reactroot'],
+    'vue': [r'\bv-', r'\b__vue', r'\bvue-'],
+    'angular': [r'\bng-', r'\b_ng', r'\bangular'],
+    'svelte': [r'\bsvelte-', r'\b__svelte'],
+    'next': [r'\b__NEXT', r'\bnext-'],
+    'nuxt': [r'\b__NUXT', r'\bnuxt-'],
+    'gatsby': [r'\bgatsby-', r'\b___gatsby'],
+}
+
+def _compile_table(table: Dict[Any, List[str]]) -> Dict[Any, "re.Pattern"]:
+    """Compile one alternation per entry of a pattern table."""
+    return {name: _compile_alternation(patterns) for name, patterns in table.items()}
+
+
+# The literal text a pattern starts with; a character made optional by
+# the quantifier after it is not part of it
+_LEADING_LITERAL_RE = re.compile(r'\\b([\w-]+)(?![?*{])')
+
+
+def _literal_table(table: Dict[Any, List[str]]) -> Dict[Any, Optional[Tuple[str, ...]]]:
+    """
+    Map each entry of a pattern table to the lower-cased literals its
+    patterns start with, one of which must occur for any to match, or to
+    None if some pattern has no such literal.
+    """
+    literals: Dict[Any, Optional[Tuple[str, ...]]] = {}
+    for name, patterns in table.items():
+        found = []
+        for pattern in patterns:
+            match = _LEADING_LITERAL_RE.match(pattern)
+            if '|' in pattern or not match or not match.group(1).isascii():
+                found = None
+                break
+            found.append(match.group(1).lower())
+        literals[name] = tuple(found) if found is not None else None
+    return literals
+
+
+def _lower_for_literals(text: str) -> Optional[str]:
+    """
+    Lower-case text for literal checks, or return None if it holds one of
+    the non-ASCII characters re.IGNORECASE equates with ASCII letters.
+    
+    Otherwise a case-insensitive match of an ASCII literal is found by a
+    plain substring test on the result.
+    """
+    if not text.isascii() and any(chr(ch) in text for ch in _CASE_FOLDS):
+        return None
+    return text.lower()
+
+
+def _first_matching_entry(
+    text: str,
+    patterns: Dict[Any, "re.Pattern"],
+    literals: Dict[Any, Optional[Tuple[str, ...]]],
+    lowered: Optional[str]
+) -> Optional[Any]:
+    """
+    Return the first entry whose pattern matches text, skipping the regex
+    search for entries none of whose literals occur in it.
+    
+    ``lowered`` is text as returned by _lower_for_literals.
+    """
+    for name, pattern in patterns.items():
+        entry_literals = literals.get(name)
+        if (lowered is not None and entry_literals is not None
+                and not any(literal in lowered for literal in entry_literals)):
+            continue
+        if pattern.search(text):
+            return name
+    return None
+
+
+# A tag as seen by detection: (position in document order, tag name,
+# attributes, number of children). List attributes such as class are
+# whitespace-separated strings when read from lxml and lists when read
+# from a soup.
+_TagRecord = Tuple[int, str, Dict[str, Any], int]
+
+# Attributes BeautifulSoup splits into lists of whitespace-separated values
+_LIST_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+
+
+class _TagScanner:
+    """
+    lxml parser target that records the tags detection looks at.
+    
+    It sees the same parser events BeautifulSoup builds its tree from,
+    so tags, attributes and child counts (text runs, comments and tags)
+    match the soup exactly, without building any tree.
+    """
+    
+    def __init__(self):
+        self.tag_counts: Counter = Counter()
+        self.records: List[Tuple[int, str, Dict[str, Any], List[int]]] = []
+        self._position = -1
+        # Child count of each open tag; the first entry is the document
+        self._open: List[List[int]] = [[0]]
+        self._in_text = False
+    
+    def _end_text(self) -> None:
+        # A run of text between two other events is one child string
+        if self._in_text:
+            self._open[-1][0] += 1
+            self._in_text = False
+    
+    def _add_child(self) -> None:
+        self._end_text()
+        self._open[-1][0] += 1
+    
+    def start(self, tag: str, attrib: Dict[str, str], nsmap: Any = None) -> None:
+        reject_namespaced(tag, attrib)
+        
+        self._add_child()
+        self._position += 1
+        self.tag_counts[tag] += 1
+        
+        children = [0]
+        if tag in _TAG_COMPONENT_TYPES or 'class' in attrib or 'id' in attrib:
+            # lxml hands over a new dict per tag, so it is kept as is;
+            # tags without attributes share an immutable empty mapping
+            self.records.append((self._position, tag, attrib or {}, children))
+        self._open.append(children)
+    
+    def end(self, tag: str) -> None:
+        self._end_text()
+        if len(self._open) > 1:
+            self._open.pop()
+    
+    def data(self, data: str) -> None:
+        self._in_text = True
+    
+    def comment(self, text: str) -> None:
+        self._add_child()
+    
+    def pi(self, target: str, data: Optional[str] = None) -> None:
+        self._add_child()
+    
+    def doctype(self, *args: Any) -> None:
+        self._add_child()
+    
+    def close(self) -> "_TagScanner":
+        self._end_text()
+        return self
+
+
+def _scan_tags(html: str) -> Tuple[Counter, List[_TagRecord]]:
+    """
+    Count every tag and record those that can be components, straight
+    from lxml's parser events.
+    
+    Raises whatever lxml raises for markup it rejects.
+    """
+    scanner = scan_html(html, _TagScanner())
+    
+    records = [
+        (position, name, attrs, children[0])
+        for position, name, attrs, children in scanner.records
+    ]
+    return scanner.tag_counts, records
+
+
+def _scan_soup(soup: BeautifulSoup) -> Tuple[Counter, List[_TagRecord]]:
+    """BeautifulSoup fallback for _scan_tags."""
+    tag_counts: Counter = Counter()
+    records: List[_TagRecord] = []
+    
+    position = -1
+    for elem in soup.descendants:
+        if not isinstance(elem, Tag):
+            continue
+        position += 1
+        
+        name = elem.name
+        tag_counts[name] += 1
+        
+        attrs = elem.attrs
+        if name in _TAG_COMPONENT_TYPES or 'class' in attrs or 'id' in attrs:
+            records.append((position, name, attrs, len(elem.contents)))
+    
+    return tag_counts, records
+
+
+# Compiled once at import and shared by every detector
+_COMPILED_COMPONENT_PATTERNS = _compile_table(_COMPONENT_PATTERNS)
+_COMPONENT_LITERAL_INDEX = _build_literal_index(list(_COMPONENT_PATTERNS.values()))
+_COMPILED_FRAMEWORK_PATTERNS = _compile_table(_FRAMEWORK_PATTERNS)
+_FRAMEWORK_LITERALS = _literal_table(_FRAMEWORK_PATTERNS)
+_COMPILED_JS_FRAMEWORK_PATTERNS = _compile_table(_JS_FRAMEWORK_PATTERNS)
+_JS_FRAMEWORK_LITERALS = _literal_table(_JS_FRAMEWORK_PATTERNS)
+
+
 class ComponentDetector:
     """
     Detects and classifies UI components in web pages.
@@ -85,147 +625,54 @@ class ComponentDetector:
     """
     
     # Class patterns for component detection
-    COMPONENT_PATTERNS = {
-        ComponentType.NAVIGATION: [
-            r'\bnav\b', r'\bnavbar\b', r'\bnavigation\b', r'\bmenu\b',
-            r'\btop-bar\b', r'\bheader-nav\b', r'\bmain-nav\b'
-        ],
-        ComponentType.HEADER: [
-            r'\bheader\b', r'\bsite-header\b', r'\bpage-header\b',
-            r'\bmasthead\b', r'\btop-header\b'
-        ],
-        ComponentType.FOOTER: [
-            r'\bfooter\b', r'\bsite-footer\b', r'\bpage-footer\b',
-            r'\bbottom\b'
-        ],
-        ComponentType.SIDEBAR: [
-            r'\bsidebar\b', r'\bside-nav\b', r'\bside-menu\b',
-            r'\baside\b', r'\bdrawer\b'
-        ],
-        ComponentType.HERO: [
-            r'\bhero\b', r'\bjumbotron\b', r'\bbanner\b', r'\bsplash\b',
-            r'\bintro\b', r'\blead\b'
-        ],
-        ComponentType.CARD: [
-            r'\bcard\b', r'\bpanel\b', r'\btile\b', r'\bbox\b',
-            r'\bitem\b', r'\bpost\b'
-        ],
-        ComponentType.BUTTON: [
-            r'\bbtn\b', r'\bbutton\b', r'\bcta\b'
-        ],
-        ComponentType.FORM: [
-            r'\bform\b', r'\bform-group\b', r'\binput-group\b'
-        ],
-        ComponentType.MODAL: [
-            r'\bmodal\b', r'\bdialog\b', r'\bpopup\b', r'\boverlay\b',
-            r'\blightbox\b'
-        ],
-        ComponentType.DROPDOWN: [
-            r'\bdropdown\b', r'\bselect\b', r'\bpopover\b', r'\bmenu\b'
-        ],
-        ComponentType.TABS: [
-            r'\btab\b', r'\btabs\b', r'\btab-content\b', r'\btab-pane\b'
-        ],
-        ComponentType.ACCORDION: [
-            r'\baccordion\b', r'\bcollapse\b', r'\bexpandable\b',
-            r'\bfaq\b'
-        ],
-        ComponentType.CAROUSEL: [
-            r'\bcarousel\b', r'\bslider\b', r'\bslideshow\b',
-            r'\bswiper\b', r'\bslick\b', r'\bowl\b'
-        ],
-        ComponentType.TABLE: [
-            r'\btable\b', r'\bdata-table\b', r'\bgrid-table\b'
-        ],
-        ComponentType.LIST: [
-            r'\blist\b', r'\blist-group\b', r'\bitems\b'
-        ],
-        ComponentType.GRID: [
-            r'\bgrid\b', r'\brow\b', r'\bcol\b', r'\bcolumn\b',
-            r'\blayout\b'
-        ],
-        ComponentType.IMAGE_GALLERY: [
-            r'\bgallery\b', r'\bgrid-gallery\b', r'\bimage-grid\b',
-            r'\bportfolio\b'
-        ],
-        ComponentType.BREADCRUMB: [
-            r'\bbreadcrumb\b', r'\bcrumbs\b'
-        ],
-        ComponentType.PAGINATION: [
-            r'\bpagination\b', r'\bpager\b', r'\bpage-nav\b'
-        ],
-        ComponentType.ALERT: [
-            r'\balert\b', r'\bnotification\b', r'\bnotice\b',
-            r'\bmessage\b', r'\btoast\b'
-        ],
-        ComponentType.BADGE: [
-            r'\bbadge\b', r'\blabel\b', r'\btag\b', r'\bchip\b'
-        ],
-        ComponentType.PROGRESS: [
-            r'\bprogress\b', r'\bloading\b', r'\bspinner\b'
-        ],
-        ComponentType.AVATAR: [
-            r'\bavatar\b', r'\bprofile-pic\b', r'\buser-image\b'
-        ],
-        ComponentType.SEARCH: [
-            r'\bsearch\b', r'\bsearch-form\b', r'\bsearchbox\b'
-        ],
-        ComponentType.SOCIAL: [
-            r'\bsocial\b', r'\bshare\b', r'\bfollow\b'
-        ],
-        ComponentType.TESTIMONIAL: [
-            r'\btestimonial\b', r'\bquote\b', r'\breview\b'
-        ],
-        ComponentType.PRICING: [
-            r'\bpricing\b', r'\bprice\b', r'\bplan\b'
-        ],
-        ComponentType.FEATURE: [
-            r'\bfeature\b', r'\bbenefits\b', r'\bservices\b'
-        ],
-    }
+    COMPONENT_PATTERNS = _COMPONENT_PATTERNS
     
     # Framework detection patterns
-    FRAMEWORK_PATTERNS = {
-        'bootstrap': [r'\bbootstrap\b', r'\bbs-', r'\bbtn-primary\b'],
-        'tailwind': [r'\btailwind\b', r'\btext-\w+-\d+\b', r'\bbg-\w+-\d+\b'],
-        'material-ui': [r'\bMui', r'\bmaterial\b', r'\bmat-'],
-        'bulma': [r'\bbulma\b', r'\bis-\w+\b'],
-        'foundation': [r'\bfoundation\b', r'\brow\s+column\b'],
-        'semantic-ui': [r'\bsemantic\b', r'\bui\s+\w+\b'],
-        'chakra': [r'\bchakra\b', r'\bcss-\w+\b'],
-        'ant-design': [r'\bant-', r'\bantd\b'],
-    }
+    FRAMEWORK_PATTERNS = _FRAMEWORK_PATTERNS
     
     # JS Framework detection
-    JS_FRAMEWORK_PATTERNS = {
-        'react': [r'\b__react', r'\breact-', r'\bdata-reactroot'],
-        'vue': [r'\bv-', r'\b__vue', r'\bvue-'],
-        'angular': [r'\bng-', r'\b_ng', r'\bangular'],
-        'svelte': [r'\bsvelte-', r'\b__svelte'],
-        'next': [r'\b__NEXT', r'\bnext-'],
-        'nuxt': [r'\b__NUXT', r'\bnuxt-'],
-        'gatsby': [r'\bgatsby-', r'\b___gatsby'],
-    }
+    JS_FRAMEWORK_PATTERNS = _JS_FRAMEWORK_PATTERNS
     
-    def __init__(self):
-        """Initialize the component detector."""
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the component detector.
+        
+        Args:
+            cache_size: Number of results kept for repeated identical
+                pages (0 disables caching)
+        """
         self.logger = get_logger("components")
+        self._cache = ResultCache(cache_size)
         
-        # Compile patterns
-        self._compiled_patterns = {
-            comp_type: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for comp_type, patterns in self.COMPONENT_PATTERNS.items()
-        }
+        # One alternation per type/framework, so a single search tells
+        # whether any of its patterns matches. The built-in tables are
+        # compiled at import; only overridden tables are compiled here.
+        if self.COMPONENT_PATTERNS is _COMPONENT_PATTERNS:
+            self._compiled_patterns = _COMPILED_COMPONENT_PATTERNS
+            self._literal_index = _COMPONENT_LITERAL_INDEX
+        else:
+            self._compiled_patterns = _compile_table(self.COMPONENT_PATTERNS)
+            self._literal_index = _build_literal_index(
+                list(self.COMPONENT_PATTERNS.values())
+            )
         
-        self._framework_patterns = {
-            name: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for name, patterns in self.FRAMEWORK_PATTERNS.items()
-        }
+        # Literal class patterns are looked up by word; only the others
+        # (none in the built-in table) are searched as regexes
+        self._component_types = list(self.COMPONENT_PATTERNS)
         
-        self._js_framework_patterns = {
-            name: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for name, patterns in self.JS_FRAMEWORK_PATTERNS.items()
-        }
+        if self.FRAMEWORK_PATTERNS is _FRAMEWORK_PATTERNS:
+            self._framework_patterns = _COMPILED_FRAMEWORK_PATTERNS
+            self._framework_literals = _FRAMEWORK_LITERALS
+        else:
+            self._framework_patterns = _compile_table(self.FRAMEWORK_PATTERNS)
+            self._framework_literals = _literal_table(self.FRAMEWORK_PATTERNS)
+        
+        if self.JS_FRAMEWORK_PATTERNS is _JS_FRAMEWORK_PATTERNS:
+            self._js_framework_patterns = _COMPILED_JS_FRAMEWORK_PATTERNS
+            self._js_framework_literals = _JS_FRAMEWORK_LITERALS
+        else:
+            self._js_framework_patterns = _compile_table(self.JS_FRAMEWORK_PATTERNS)
+            self._js_framework_literals = _literal_table(self.JS_FRAMEWORK_PATTERNS)
     
     def detect_components(self, html: str) -> ComponentAnalysisResult:
         """
@@ -237,196 +684,322 @@ class ComponentDetector:
         Returns:
             ComponentAnalysisResult with detected components
         """
-        result = ComponentAnalysisResult()
+        key = content_key(html)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._detect_components(html)
+            self._cache.put(key, result)
+        return result
+    
+    def detect_components_from_soup(
+        self,
+        soup: BeautifulSoup,
+        html: Optional[str] = None
+    ) -> ComponentAnalysisResult:
+        """
+        Detect UI components in an already parsed page.
+        
+        The components' markup and text are read from ``soup`` itself,
+        so it should not be modified while the result is in use. Results
+        are not cached, since they refer to the caller's tree.
+        
+        Framework detection searches the page's HTML. Pass the markup
+        ``soup`` was parsed from when you have it; otherwise the tree is
+        serialized once more, which costs about as much as the scan, and
+        frameworks are looked for in BeautifulSoup's normalized markup
+        (quoting, entities and whitespace may differ from the original).
         
+        Args:
+            soup: Parsed HTML document to analyze
+            html: The markup ``soup`` was parsed from, if available
+            
+        Returns:
+            ComponentAnalysisResult with detected components
+        """
+        if html is None:
+            html = str(soup)
+        tag_counts, tags = _scan_soup(soup)
+        return self._analyze(html, tag_counts, tags, _ElementSource(html, soup))
+    
+    def _detect_components(self, html: str) -> ComponentAnalysisResult:
+        """Run detection on ``html`` without consulting the cache."""
+        # Read the tags off lxml's parser events; the BeautifulSoup tree is
+        # only built for markup lxml rejects, or later for component markup
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            tag_counts, tags = _scan_tags(html)
         except Exception:
-            soup = BeautifulSoup(html, 'html.parser')
+            tag_counts, tags = _scan_soup(_parse_html(html))
         
-        # Detect frameworks first
-        result.css_framework = self._detect_css_framework(html)
-        result.framework_detected = self._detect_js_framework(html)
-        
-        # Analyze document structure
-        result.structure_info = self._analyze_structure(soup)
+        return self._analyze(html, tag_counts, tags, _ElementSource(html))
+    
+    def _detect(self, page: Union[str, BeautifulSoup]) -> ComponentAnalysisResult:
+        """Detect components in HTML content or an already parsed page."""
+        if isinstance(page, BeautifulSoup):
+            return self.detect_components_from_soup(page)
+        return self.detect_components(page)
+    
+    def _analyze(
+        self,
+        html: str,
+        tag_counts: Counter,
+        tags: List[_TagRecord],
+        source: _ElementSource
+    ) -> ComponentAnalysisResult:
+        """Build the analysis result from a page's scanned tags."""
+        result = ComponentAnalysisResult()
         
-        # Detect components by tag
-        self._detect_by_tag(soup, result)
+        # Detect frameworks first
+        result.css_framework, result.framework_detected = self._detect_frameworks(html)
         
-        # Detect components by class/attribute patterns
-        self._detect_by_patterns(soup, result)
+        # Analyze structure and detect components by tag and by pattern
+        self._single_pass(tag_counts, tags, result, source)
         
-        # Count components by type
-        for component in result.components:
-            type_name = component.component_type.value
-            result.component_counts[type_name] = \
-                result.component_counts.get(type_name, 0) + 1
+        # Count components by type; members are counted and only the
+        # distinct ones are translated to their names
+        counts = Counter(component.component_type for component in result.components)
+        result.component_counts = {
+            comp_type.value: count for comp_type, count in counts.items()
+        }
         
         return result
     
+    def _detect_frameworks(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        """Detect the CSS and JavaScript frameworks, lower-casing the page once."""
+        lowered = _lower_for_literals(html)
+        css_framework = _first_matching_entry(
+            html, self._framework_patterns, self._framework_literals, lowered
+        )
+        js_framework = _first_matching_entry(
+            html, self._js_framework_patterns, self._js_framework_literals, lowered
+        )
+        return css_framework, js_framework
+    
     def _detect_css_framework(self, html: str) -> Optional[str]:
         """Detect CSS framework used in the page."""
-        for framework, patterns in self._framework_patterns.items():
-            for pattern in patterns:
-                if pattern.search(html):
-                    return framework
-        return None
+        return _first_matching_entry(
+            html, self._framework_patterns, self._framework_literals,
+            _lower_for_literals(html)
+        )
     
     def _detect_js_framework(self, html: str) -> Optional[str]:
         """Detect JavaScript framework used in the page."""
-        for framework, patterns in self._js_framework_patterns.items():
-            for pattern in patterns:
-                if pattern.search(html):
-                    return framework
-        return None
-    
-    def _analyze_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Analyze the overall document structure."""
-        structure = {
-            'has_header': bool(soup.find('header')),
-            'has_footer': bool(soup.find('footer')),
-            'has_main': bool(soup.find('main')),
-            'has_aside': bool(soup.find('aside')),
-            'has_nav': bool(soup.find('nav')),
-            'has_article': bool(soup.find('article')),
-            'has_section': len(soup.find_all('section')),
-            'heading_structure': self._get_heading_structure(soup),
-            'semantic_score': 0,
-            'total_elements': len(soup.find_all()),
-        }
-        
-        # Calculate semantic score
-        semantic_tags = ['header', 'footer', 'main', 'nav', 'article', 'section', 'aside']
-        for tag in semantic_tags:
-            if soup.find(tag):
-                structure['semantic_score'] += 1
-        
-        structure['semantic_score'] = structure['semantic_score'] / len(semantic_tags)
-        
-        return structure
+        return _first_matching_entry(
+            html, self._js_framework_patterns, self._js_framework_literals,
+            _lower_for_literals(html)
+        )
     
-    def _get_heading_structure(self, soup: BeautifulSoup) -> Dict[str, int]:
-        """Get the heading structure of the document."""
-        headings = {}
-        for i in range(1, 7):
-            count = len(soup.find_all(f'h{i}'))
-            if count > 0:
-                headings[f'h{i}'] = count
-        return headings
-    
-    def _detect_by_tag(
+    def _single_pass(
         self,
-        soup: BeautifulSoup,
-        result: ComponentAnalysisResult
+        tag_counts: Counter,
+        tags: List[_TagRecord],
+        result: ComponentAnalysisResult,
+        source: _ElementSource
     ) -> None:
-        """Detect components by semantic HTML tags."""
-        tag_mappings = {
-            'nav': ComponentType.NAVIGATION,
-            'header': ComponentType.HEADER,
-            'footer': ComponentType.FOOTER,
-            'aside': ComponentType.SIDEBAR,
-            'form': ComponentType.FORM,
-            'table': ComponentType.TABLE,
-            'button': ComponentType.BUTTON,
-        }
+        """
+        Analyze structure and detect components from one scan of the tags.
         
-        for tag, comp_type in tag_mappings.items():
-            for elem in soup.find_all(tag):
-                component = self._create_component(elem, comp_type, 0.9)
-                result.components.append(component)
-    
-    def _detect_by_patterns(
-        self,
-        soup: BeautifulSoup,
-        result: ComponentAnalysisResult
-    ) -> None:
-        """Detect components by class/attribute patterns."""
+        Components found by semantic tag are reported first, grouped in
+        the order of _TAG_COMPONENT_TYPES, followed by those found by
+        class/id patterns in document order.
+        """
+        by_tag: Dict[str, List[_TagRecord]] = {tag: [] for tag in _TAG_COMPONENT_TYPES}
+        candidates: List[_TagRecord] = []
+        class_strs: List[str] = []
+        id_attrs: List[str] = []
         seen_selectors: Set[str] = set()
         
-        for elem in soup.find_all(True):  # All elements
-            if not isinstance(elem, Tag):
+        for tag in tags:
+            name = tag[1]
+            attrs = tag[2]
+            
+            # Detect components by semantic HTML tags
+            if name in by_tag:
+                by_tag[name].append(tag)
+            
+            # Detect components by class/attribute patterns; an element
+            # with neither attribute cannot match, so skip the work
+            if 'class' not in attrs and 'id' not in attrs:
                 continue
             
-            classes = elem.get('class', [])
+            classes = attrs.get('class', [])
             if isinstance(classes, str):
                 classes = classes.split()
             
-            class_str = ' '.join(classes)
-            id_attr = elem.get('id', '')
+            candidates.append(tag)
+            class_strs.append(' '.join(classes))
+            id_attrs.append(attrs.get('id', ''))
+        
+        # Match every candidate in one batch, then keep the first element
+        # per selector in document order
+        pattern_hits: List[Tuple[_TagRecord, ComponentType, str]] = []
+        seen_elements: Set[Tuple[str, str, str]] = set()
+        detected_types = self._match_component_types(class_strs, id_attrs)
+        for tag, class_str, id_attr, detected_type in zip(
+            candidates, class_strs, id_attrs, detected_types
+        ):
+            if detected_type is None:
+                continue
+            
+            # Repeated elements (list items, product cards) share tag name,
+            # id and classes, and so their selector; skip them before
+            # building it again
+            key = (tag[1], id_attr, class_str)
+            if key in seen_elements:
+                continue
+            seen_elements.add(key)
             
             # Skip if already processed
-            selector = self._build_selector(elem)
+            selector = self._build_selector(tag[1], tag[2])
             if selector in seen_selectors:
                 continue
             
-            # Check against patterns
-            detected_type = None
-            confidence = 0.0
-            
-            for comp_type, patterns in self._compiled_patterns.items():
-                for pattern in patterns:
-                    if pattern.search(class_str) or (id_attr and pattern.search(id_attr)):
-                        detected_type = comp_type
-                        confidence = 0.8
-                        break
-                if detected_type:
-                    break
-            
-            if detected_type:
-                component = self._create_component(elem, detected_type, confidence)
+            pattern_hits.append((tag, detected_type, selector))
+            seen_selectors.add(selector)
+        
+        result.structure_info = self._analyze_structure(tag_counts)
+        
+        for name, comp_type in _TAG_COMPONENT_TYPES.items():
+            for tag in by_tag[name]:
+                component = self._create_component(tag, comp_type, 0.9, source)
                 result.components.append(component)
-                seen_selectors.add(selector)
+        
+        for tag, comp_type, selector in pattern_hits:
+            component = self._create_component(tag, comp_type, 0.8, source, selector)
+            result.components.append(component)
+    
+    def _analyze_structure(self, tag_counts: Counter) -> Dict[str, Any]:
+        """Analyze the overall document structure from per-tag counts."""
+        structure = {
+            'has_header': 'header' in tag_counts,
+            'has_footer': 'footer' in tag_counts,
+            'has_main': 'main' in tag_counts,
+            'has_aside': 'aside' in tag_counts,
+            'has_nav': 'nav' in tag_counts,
+            'has_article': 'article' in tag_counts,
+            'has_section': tag_counts['section'],
+            'heading_structure': self._get_heading_structure(tag_counts),
+            'semantic_score': 0,
+            'total_elements': sum(tag_counts.values()),
+        }
+        
+        # Calculate semantic score
+        present = sum(1 for tag in _SEMANTIC_TAGS if tag in tag_counts)
+        structure['semantic_score'] = present / len(_SEMANTIC_TAGS)
+        
+        return structure
+    
+    def _get_heading_structure(self, tag_counts: Counter) -> Dict[str, int]:
+        """Get the heading structure of the document."""
+        return {tag: tag_counts[tag] for tag in _HEADING_TAGS if tag in tag_counts}
+    
+    def _match_component_types(
+        self,
+        class_strs: List[str],
+        id_attrs: List[str]
+    ) -> List[Optional[ComponentType]]:
+        """
+        Return, per element, the first component type whose patterns match
+        its class string or id.
+        """
+        if self._literal_index is None:
+            return [
+                self._match_component_type(class_str, id_attr)
+                for class_str, id_attr in zip(class_strs, id_attrs)
+            ]
+        
+        # Pages repeat the same few class strings (and ids) across many
+        # elements, so each distinct string is scanned once and the rest
+        # are dictionary lookups
+        texts = list(dict.fromkeys(class_strs + id_attrs))
+        matches = dict(zip(texts, _first_literal_matches(texts, *self._literal_index)))
+        
+        detected: List[Optional[ComponentType]] = []
+        for class_str, id_attr in zip(class_strs, id_attrs):
+            # An empty id is never searched (see _match_component_type)
+            class_best = matches[class_str]
+            id_best = matches[id_attr] if id_attr else None
+            if class_best is None:
+                best = id_best
+            elif id_best is None:
+                best = class_best
+            else:
+                best = min(class_best, id_best)
+            detected.append(self._component_types[best] if best is not None else None)
+        return detected
+    
+    def _match_component_type(
+        self,
+        class_str: str,
+        id_attr: str
+    ) -> Optional[ComponentType]:
+        """Return the first component type whose patterns match class or id."""
+        for comp_type, pattern in self._compiled_patterns.items():
+            if pattern.search(class_str) or (id_attr and pattern.search(id_attr)):
+                return comp_type
+        return None
     
     def _create_component(
         self,
-        elem: Tag,
+        tag: _TagRecord,
         comp_type: ComponentType,
-        confidence: float
+        confidence: float,
+        source: Optional[_ElementSource] = None,
+        selector: Optional[str] = None
     ) -> DetectedComponent:
-        """Create a DetectedComponent from a BeautifulSoup element."""
-        classes = elem.get('class', [])
-        if isinstance(classes, str):
-            classes = classes.split()
+        """
+        Create a DetectedComponent from a scanned tag.
         
-        # Get a clean version of inner HTML (limited length)
-        inner_html = str(elem)
-        if len(inner_html) > 1000:
-            inner_html = inner_html[:1000] + "..."
+        Markup and text are left to the component to compute from
+        ``source`` when first accessed.
+        """
+        position, name, elem_attrs, children_count = tag
         
-        # Get text content (limited)
-        text = elem.get_text(strip=True)
-        if len(text) > 500:
-            text = text[:500] + "..."
+        # Build attributes dict, with list attributes split the way
+        # BeautifulSoup stores them
+        attrs = dict(elem_attrs)
+        list_attributes = _LIST_ATTRIBUTES.get(name, ())
+        for attr, value in elem_attrs.items():
+            if isinstance(value, str) and (
+                attr in _LIST_ATTRIBUTES['*'] or attr in list_attributes
+            ):
+                attrs[attr] = value.split()
         
-        # Build attributes dict
-        attrs = dict(elem.attrs)
-        if 'class' in attrs:
-            attrs['class'] = ' '.join(attrs['class']) if isinstance(attrs['class'], list) else attrs['class']
+        classes = attrs.get('class', [])
+        if isinstance(classes, str):
+            classes = classes.split()
+        elif 'class' in attrs:
+            attrs['class'] = ' '.join(classes)
+        
+        # The same few class names ("row", "btn", ...) repeat across most
+        # components of a page; keep one string object per name
+        classes = [sys.intern(class_name) for class_name in classes]
         
-        return DetectedComponent(
+        component = DetectedComponent(
             component_type=comp_type,
-            selector=self._build_selector(elem),
-            tag_name=elem.name,
+            selector=selector or self._build_selector(name, elem_attrs),
+            tag_name=name,
             class_names=classes,
-            id_attr=elem.get('id'),
-            inner_html=inner_html,
+            id_attr=attrs.get('id'),
+            inner_html=UNREAD,
             attributes=attrs,
-            children_count=len(list(elem.children)),
-            text_content=text,
+            children_count=children_count,
+            text_content=UNREAD,
             confidence=confidence
         )
+        # Plain attributes rather than fields, so they stay out of the
+        # constructor, repr, comparisons and asdict()
+        component._source = source
+        component._position = position
+        return component
     
-    def _build_selector(self, elem: Tag) -> str:
-        """Build a CSS selector for an element."""
-        tag = elem.name
-        
+    def _build_selector(self, tag: str, attrs: Dict[str, Any]) -> str:
+        """Build a CSS selector for an element from its name and attributes."""
         # Use ID if available
-        if elem.get('id'):
-            return f"{tag}#{elem['id']}"
+        if attrs.get('id'):
+            return f"{tag}#{attrs['id']}"
         
         # Use classes
-        classes = elem.get('class', [])
+        classes = attrs.get('class', [])
         if isinstance(classes, str):
             classes = classes.split()
         
@@ -436,17 +1009,17 @@ class ComponentDetector:
         
         return tag
     
-    def get_component_tree(self, html: str) -> Dict[str, Any]:
+    def get_component_tree(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """
         Build a hierarchical tree of detected components.
         
         Args:
-            html: HTML content to analyze
+            html: HTML content to analyze, or an already parsed page
             
         Returns:
             Nested dictionary representing component hierarchy
         """
-        result = self.detect_components(html)
+        result = self._detect(html)
         
         tree = {
             'structure': result.structure_info,
@@ -455,13 +1028,15 @@ class ComponentDetector:
             'components': {},
         }
         
-        # Group components by type
+        # Group components by type, keyed by enum member (hashed by
+        # identity) and renamed to the type's value once per group
+        groups: Dict[ComponentType, List[Dict[str, Any]]] = {}
         for component in result.components:
-            type_name = component.component_type.value
-            if type_name not in tree['components']:
-                tree['components'][type_name] = []
+            group = groups.get(component.component_type)
+            if group is None:
+                group = groups[component.component_type] = []
             
-            tree['components'][type_name].append({
+            group.append({
                 'selector': component.selector,
                 'tag': component.tag_name,
                 'classes': component.class_names,
@@ -469,27 +1044,32 @@ class ComponentDetector:
                 'confidence': component.confidence,
             })
         
+        tree['components'] = {
+            comp_type.value: group for comp_type, group in groups.items()
+        }
         return tree
     
     def extract_component_html(
         self,
-        html: str,
+        html: Union[str, BeautifulSoup],
         component_type: ComponentType
     ) -> List[str]:
         """
         Extract HTML for all components of a specific type.
         
         Args:
-            html: HTML content to search
+            html: HTML content to search, or an already parsed page
             component_type: Type of component to extract
             
         Returns:
             List of HTML strings for matching components
         """
-        result = self.detect_components(html)
+        result = self._detect(html)
         
+        # Enum members are singletons (also across cached copies), so an
+        # identity check is enough
         return [
             comp.inner_html
             for comp in result.components
-            if comp.component_type == component_type
+            if comp.component_type is component_type
         ]
@@ -4,17 +4,254 @@ Form analyzer module for extracting form information.
 Extracts form fields, validation rules, and structure.
 """
 
+import os
+import re
+import threading
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
 
+from ..utils.cache import ResultCache, content_key
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.log import get_logger
+from ..utils.markup import LazyField, UNREAD
+
+# Input types left out of a form's field list
+_SKIP_INPUT_TYPES = frozenset({'hidden', 'submit', 'button', 'reset', 'image'})
+
+# Input types whose options are the labels of every input in their group
+_GROUP_INPUT_TYPES = frozenset({'radio', 'checkbox'})
+
+# Hidden input names used for CSRF tokens
+_CSRF_NAMES = frozenset({
+    'csrf', 'csrf_token', '_token', 'authenticity_token', '__RequestVerificationToken'
+})
+
+# Markup fragments that indicate a CAPTCHA widget, searched for in the
+# names, attribute values and strings of a form's markup
+_CAPTCHA_INDICATORS = ('recaptcha', 'captcha', 'hcaptcha', 'g-recaptcha')
+# Every indicator contains the shortest one, so a single substring test
+# on lower-cased text finds any of them
+_CAPTCHA_NEEDLE = min(_CAPTCHA_INDICATORS, key=len)
+
+# Substrings of lower-cased field names that point to a kind of form
+_NAME_KEYWORDS = {
+    'email': ('email',),
+    'confirm': ('confirm', 'repeat'),
+    'search': ('search',),
+    'payment': ('card', 'credit', 'payment', 'cvv', 'expiry'),
+    'address': ('address', 'street', 'city', 'zip', 'postal', 'country', 'state'),
+}
+_KEYWORD_CATEGORIES = {
+    keyword: category
+    for category, keywords in _NAME_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# A lookahead finds every keyword in a name in one scan, including ones
+# that overlap (e.g. 'addressearch'); no keyword is a prefix of another,
+# so at most one starts at each position
+_NAME_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _KEYWORD_CATEGORIES) + '))'
+)
+
+# Whole field names that point to a kind of form
+_USERNAME_NAMES = frozenset({'username', 'user', 'login'})
+_CONTACT_NAMES = frozenset({'message', 'comment', 'body', 'content', 'subject'})
+
+# Tags a form's fields, submit button and CSRF token are read from
+_CONTROL_TAGS = ('input', 'select', 'textarea', 'button')
+
+
+@lru_cache(maxsize=1024)
+def _classify_form(
+    field_names: Tuple[str, ...],
+    field_types: FrozenSet[str],
+    field_count: int
+) -> str:
+    """
+    Classify a form from its lower-cased field names and field types.
+    
+    Memoized, since sites repeat the same search, login and newsletter
+    forms on every page.
+    """
+    # Whole-name checks look the names up in one set
+    name_set = frozenset(field_names)
+    
+    # Number of field names containing a keyword of each category
+    name_matches: Counter = Counter()
+    for n in field_names:
+        name_matches.update({
+            _KEYWORD_CATEGORIES[match.group(1)]
+            for match in _NAME_KEYWORD_RE.finditer(n)
+        })
+    
+    # Check for login form
+    has_password = 'password' in field_types
+    has_email = 'email' in field_types or name_matches['email'] > 0
+    has_username = not _USERNAME_NAMES.isdisjoint(name_set)
+    
+    if has_password and (has_email or has_username) and field_count <= 3:
+        return 'login'
+    
+    # Check for registration form
+    if has_password and has_email and field_count > 3:
+        if name_matches['confirm']:
+            return 'registration'
+    
+    # Check for search form
+    if field_count == 1:
+        if 'search' in field_types or name_matches['search'] or 'q' in name_set:
+            return 'search'
+    
+    # Check for contact form
+    has_message = not _CONTACT_NAMES.isdisjoint(name_set)
+    has_textarea = 'textarea' in field_types
+    
+    if has_email and (has_message or has_textarea):
+        return 'contact'
+    
+    # Check for newsletter/subscribe form
+    if has_email and field_count <= 2:
+        return 'newsletter'
+    
+    # Check for checkout/payment form
+    if name_matches['payment']:
+        return 'payment'
+    
+    # Check for address form
+    if name_matches['address'] >= 3:
+        return 'address'
+    
+    return 'other'
+
+
+def _form_controls(form: Tag) -> Dict[str, List[Tag]]:
+    """Group a form's control tags by name, in document order, in one walk."""
+    controls: Dict[str, List[Tag]] = {name: [] for name in _CONTROL_TAGS}
+    for elem in form.find_all(_CONTROL_TAGS):
+        controls[elem.name].append(elem)
+    return controls
+
+
+def _mentions_captcha(form: Tag) -> bool:
+    """
+    Tell whether a CAPTCHA indicator occurs anywhere in a form's markup.
+    
+    Looks at the same text str(form) would contain, piece by piece: tag
+    and attribute names, attribute values and every string. Escaping
+    only adds entities around '&', '<', '>' and '"', which cannot form
+    or split an indicator, so nothing has to be serialized.
+    """
+    needle = _CAPTCHA_NEEDLE
+    for node in (form, *form.descendants):
+        if isinstance(node, NavigableString):
+            if needle in node.lower():
+                return True
+            continue
+        if needle in node.name.lower():
+            return True
+        for name, value in node.attrs.items():
+            if not isinstance(value, str):
+                value = ' '.join(value)
+            if needle in name.lower() or needle in value.lower():
+                return True
+    return False
+
+
+class _FormSource:
+    """
+    The page a form analysis read, for serializing forms on demand.
+    
+    Forms are addressed by their index among the page's forms, fields by
+    their form, tag name and index among the form's tags of that name.
+    The first access serializes every form (limited to 2000 characters)
+    and every field control at once: the page's HTML, when known, is
+    parsed again with the same builder, otherwise the caller's soup is
+    read. Only those strings are kept afterwards, so results don't hold
+    on to a tree or to the page. Copies of a result share the source.
+    """
+    
+    def __init__(self, html: Optional[str], soup: BeautifulSoup):
+        self._html = html
+        self._builder = type(soup.builder)
+        self._forms: Optional[List[Tag]] = None
+        if html is None:
+            self._forms = soup.find_all('form')
+        self._form_markup: Optional[List[str]] = None
+        self._control_markup: Dict[Tuple[int, str], List[str]] = {}
+        self._lock = threading.Lock()
+    
+    def _serialize(self) -> None:
+        """Serialize the page's forms and controls, then let go of the page."""
+        forms = self._forms
+        if forms is None:
+            forms = BeautifulSoup(self._html, builder=self._builder).find_all('form')
+        control_markup: Dict[Tuple[int, str], List[str]] = {}
+        for form_index, form in enumerate(forms):
+            controls = _form_controls(form)
+            for name in ('input', 'select', 'textarea'):
+                control_markup[form_index, name] = [str(c) for c in controls[name]]
+        self._form_markup = [str(form)[:2000] for form in forms]
+        self._control_markup = control_markup
+        self._html = None
+        self._forms = None
+    
+    def form(self, index: int) -> str:
+        """Return the markup of the form at ``index``, up to 2000 characters."""
+        with self._lock:
+            if self._form_markup is None:
+                self._serialize()
+        return self._form_markup[index]
+    
+    def control(self, form_index: int, name: str, index: int) -> str:
+        """Return the markup of a form's ``index``-th control called ``name``."""
+        with self._lock:
+            if self._form_markup is None:
+                self._serialize()
+        return self._control_markup[form_index, name][index]
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_FormSource":
+        return self
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Results cross process boundaries in analyze_many; the lock is
+        # recreated there. A page known by its HTML travels as that HTML,
+        # the caller's soup only as the serialized markup
+        with self._lock:
+            if self._form_markup is None and self._html is None:
+                self._serialize()
+            state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _field_markup(fld: "FormField") -> str:
+    """A field's markup, read from the page it was found in."""
+    return fld._source.control(*fld._address)
+
+
+def _form_markup(form_info: "FormInfo") -> str:
+    """A form's markup, limited to 2000 characters."""
+    return form_info._source.form(form_info._index)
 
 
 @dataclass
 class FormField:
-    """Represents a form field."""
+    """
+    Represents a form field.
+    
+    For analyzed fields, html is serialized from the page on first
+    access (and cached in the instance __dict__, which is why the class
+    has no __slots__).
+    """
     name: str
     field_type: str  # text, email, password, select, textarea, etc.
     label: Optional[str] = None
@@ -30,12 +267,16 @@ class FormField:
     autocomplete: Optional[str] = None
     validation_message: Optional[str] = None
     aria_label: Optional[str] = None
-    html: str = ""
+    html: str = LazyField(_field_markup, default="")
 
 
 @dataclass
 class FormInfo:
-    """Information about a form."""
+    """
+    Information about a form.
+    
+    For analyzed forms, html is serialized from the page on first access.
+    """
     form_id: Optional[str] = None
     form_name: Optional[str] = None
     action: Optional[str] = None
@@ -45,10 +286,10 @@ class FormInfo:
     submit_button: Optional[Dict[str, str]] = None
     has_csrf: bool = False
     has_captcha: bool = False
-    html: str = ""
+    html: str = LazyField(_form_markup, default="")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FormAnalysisResult:
     """Result of form analysis."""
     forms: List[FormInfo] = field(default_factory=list)
@@ -58,6 +299,49 @@ class FormAnalysisResult:
     field_types: Dict[str, int] = field(default_factory=dict)
 
 
+class _PageIndex:
+    """
+    Labels and input groups of a page, indexed once per analysis.
+    
+    Lookups give the same results as searching the page each time: the
+    first label in document order for an id, and every input sharing a
+    name, in document order.
+    """
+    
+    def __init__(self, soup: BeautifulSoup):
+        self._labels: Dict[str, Tag] = {}
+        for label in soup.find_all('label'):
+            for_id = label.get('for')
+            if for_id and for_id not in self._labels:
+                self._labels[for_id] = label
+        
+        self._groups: Dict[str, List[Tag]] = defaultdict(list)
+        for inp in soup.find_all('input'):
+            name = inp.get('name')
+            if name is not None:
+                self._groups[name].append(inp)
+        
+        self._group_options: Dict[str, List[str]] = {}
+    
+    def label_text(self, elem_id: Optional[str]) -> Optional[str]:
+        """Return the text of the label for ``elem_id``, if there is one."""
+        if elem_id:
+            label = self._labels.get(elem_id)
+            if label:
+                return label.get_text(strip=True)
+        return None
+    
+    def group_options(self, name: str) -> List[str]:
+        """Return the label (or value) of every input named ``name``."""
+        options = self._group_options.get(name)
+        if options is None:
+            options = self._group_options[name] = [
+                self.label_text(inp.get('id')) or inp.get('value', '')
+                for inp in self._groups.get(name, ())
+            ]
+        return list(options)
+
+
 class FormAnalyzer:
     """
     Analyzes forms in web pages.
@@ -66,38 +350,74 @@ class FormAnalyzer:
     """
     
     # Input types
-    INPUT_TYPES = {
+    INPUT_TYPES = frozenset({
         'text', 'email', 'password', 'number', 'tel', 'url',
         'search', 'date', 'time', 'datetime-local', 'month',
         'week', 'color', 'range', 'file', 'hidden', 'checkbox',
         'radio', 'submit', 'button', 'reset', 'image'
-    }
+    })
     
-    def __init__(self):
-        """Initialize the form analyzer."""
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the form analyzer.
+        
+        Args:
+            cache_size: Number of results kept for repeated identical
+                pages (0 disables caching)
+        """
         self.logger = get_logger("forms")
+        self._cache = ResultCache(cache_size)
     
-    def analyze(self, html: str) -> FormAnalysisResult:
+    def analyze(
+        self,
+        html: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
+    ) -> FormAnalysisResult:
         """
         Analyze forms in HTML content.
         
         Args:
             html: HTML content to analyze
+            soup: Already parsed page, used instead of parsing ``html``
+                (if both are given, ``soup`` must be ``html`` as parsed).
+                Results are cached by ``html``; a soup given without it
+                is analyzed every time.
             
         Returns:
             FormAnalysisResult with extracted form information
         """
+        if html is None:
+            if soup is None:
+                raise ValueError("either html or soup is required")
+            return self._analyze(None, soup)
+        
+        key = content_key(html)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._analyze(html, soup)
+            self._cache.put(key, result)
+        return result
+    
+    def _analyze(
+        self,
+        html: Optional[str],
+        soup: Optional[BeautifulSoup]
+    ) -> FormAnalysisResult:
+        """Analyze forms without consulting the cache."""
         result = FormAnalysisResult()
         
-        try:
-            soup = BeautifulSoup(html, 'lxml')
-        except Exception:
-            soup = BeautifulSoup(html, 'html.parser')
+        if soup is None:
+            try:
+                soup = BeautifulSoup(html, 'lxml')
+            except Exception:
+                soup = BeautifulSoup(html, 'html.parser')
         
         forms = soup.find_all('form')
+        page = _PageIndex(soup) if forms else None
+        source = _FormSource(html, soup) if forms else None
         
-        for form in forms:
-            form_info = self._analyze_form(form, soup)
+        for form_index, form in enumerate(forms):
+            form_info = self._analyze_form(form, page, source, form_index)
             result.forms.append(form_info)
             
             # Count fields by type
@@ -114,22 +434,55 @@ class FormAnalyzer:
         
         return result
     
-    def _analyze_form(self, form: Tag, soup: BeautifulSoup) -> FormInfo:
+    @classmethod
+    def analyze_many(
+        cls,
+        htmls: Iterable[str],
+        workers: Optional[int] = None
+    ) -> List[FormAnalysisResult]:
+        """
+        Analyze forms on several pages in parallel worker processes.
+        
+        Args:
+            htmls: HTML content of each page
+            workers: Number of processes (defaults to the CPU count)
+            
+        Returns:
+            FormAnalysisResult for each page, in input order
+        """
+        # Imported here: multiprocessing is only needed for batches
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(_analyze_one_html, htmls, chunksize=8))
+    
+    def _analyze_form(
+        self,
+        form: Tag,
+        page: _PageIndex,
+        source: _FormSource,
+        form_index: int
+    ) -> FormInfo:
         """Analyze a single form element."""
+        controls = _form_controls(form)
         form_info = FormInfo(
             form_id=form.get('id'),
             form_name=form.get('name'),
             action=form.get('action', ''),
             method=form.get('method', 'get').lower(),
             enctype=form.get('enctype'),
-            html=str(form)[:2000]
+            html=UNREAD
         )
+        # Plain attributes rather than fields, so they stay out of the
+        # constructor, repr, comparisons and asdict()
+        form_info._source, form_info._index = source, form_index
         
         # Extract all form fields
-        form_info.fields = self._extract_fields(form, soup)
+        form_info.fields = self._extract_fields(controls, page, source, form_index)
         
         # Find submit button
-        submit = form.find('button', type='submit') or form.find('input', type='submit')
+        submit = self._first_of_type(controls['button'], 'submit') or \
+            self._first_of_type(controls['input'], 'submit')
         if submit:
             form_info.submit_button = {
                 'text': submit.get_text(strip=True) if submit.name == 'button' else submit.get('value', 'Submit'),
@@ -137,45 +490,58 @@ class FormAnalyzer:
             }
         
         # Check for CSRF token
-        csrf_names = {'csrf', 'csrf_token', '_token', 'authenticity_token', '__RequestVerificationToken'}
-        for name in csrf_names:
-            if form.find('input', attrs={'name': name}):
-                form_info.has_csrf = True
-                break
+        form_info.has_csrf = any(
+            inp.get('name') in _CSRF_NAMES for inp in controls['input']
+        )
         
         # Check for CAPTCHA
-        captcha_indicators = ['recaptcha', 'captcha', 'hcaptcha', 'g-recaptcha']
-        form_str = str(form).lower()
-        for indicator in captcha_indicators:
-            if indicator in form_str:
-                form_info.has_captcha = True
-                break
+        form_info.has_captcha = _mentions_captcha(form)
         
         return form_info
     
-    def _extract_fields(self, form: Tag, soup: BeautifulSoup) -> List[FormField]:
-        """Extract all fields from a form."""
+    def _first_of_type(self, elems: List[Tag], elem_type: str) -> Optional[Tag]:
+        """Return the first element whose type attribute is ``elem_type``."""
+        for elem in elems:
+            if elem.get('type') == elem_type:
+                return elem
+        return None
+    
+    def _extract_fields(
+        self,
+        controls: Dict[str, List[Tag]],
+        page: _PageIndex,
+        source: _FormSource,
+        form_index: int
+    ) -> List[FormField]:
+        """Extract all fields from a form's controls."""
+        # Listed inputs first, then selects, then textareas
         fields = []
         
         # Input elements
-        for input_elem in form.find_all('input'):
+        for index, input_elem in enumerate(controls['input']):
             input_type = input_elem.get('type', 'text').lower()
             
             # Skip hidden, submit, button types for main field list
-            if input_type in {'hidden', 'submit', 'button', 'reset', 'image'}:
+            if input_type in _SKIP_INPUT_TYPES:
                 continue
             
-            field = self._create_field_from_input(input_elem, soup)
+            field = self._create_field_from_input(input_elem, page)
+            field._source, field._address = source, (form_index, 'input', index)
+            field.html = UNREAD
             fields.append(field)
         
         # Select elements
-        for select in form.find_all('select'):
-            field = self._create_field_from_select(select, soup)
+        for index, select in enumerate(controls['select']):
+            field = self._create_field_from_select(select, page)
+            field._source, field._address = source, (form_index, 'select', index)
+            field.html = UNREAD
             fields.append(field)
         
         # Textarea elements
-        for textarea in form.find_all('textarea'):
-            field = self._create_field_from_textarea(textarea, soup)
+        for index, textarea in enumerate(controls['textarea']):
+            field = self._create_field_from_textarea(textarea, page)
+            field._source, field._address = source, (form_index, 'textarea', index)
+            field.html = UNREAD
             fields.append(field)
         
         return fields
@@ -183,7 +549,7 @@ class FormAnalyzer:
     def _create_field_from_input(
         self,
         input_elem: Tag,
-        soup: BeautifulSoup
+        page: _PageIndex
     ) -> FormField:
         """Create FormField from an input element."""
         input_type = input_elem.get('type', 'text').lower()
@@ -191,25 +557,12 @@ class FormAnalyzer:
         input_id = input_elem.get('id')
         
         # Find associated label
-        label = None
-        if input_id:
-            label_elem = soup.find('label', attrs={'for': input_id})
-            if label_elem:
-                label = label_elem.get_text(strip=True)
+        label = page.label_text(input_id)
         
         # For radio/checkbox, get options
         options = []
-        if input_type in {'radio', 'checkbox'}:
-            group_inputs = soup.find_all('input', attrs={'name': name})
-            for inp in group_inputs:
-                value = inp.get('value', '')
-                inp_label = None
-                inp_id = inp.get('id')
-                if inp_id:
-                    inp_label_elem = soup.find('label', attrs={'for': inp_id})
-                    if inp_label_elem:
-                        inp_label = inp_label_elem.get_text(strip=True)
-                options.append(inp_label or value)
+        if input_type in _GROUP_INPUT_TYPES:
+            options = page.group_options(name)
         
         return FormField(
             name=name,
@@ -225,25 +578,20 @@ class FormAnalyzer:
             options=options,
             default_value=input_elem.get('value'),
             autocomplete=input_elem.get('autocomplete'),
-            aria_label=input_elem.get('aria-label'),
-            html=str(input_elem)
+            aria_label=input_elem.get('aria-label')
         )
     
     def _create_field_from_select(
         self,
         select: Tag,
-        soup: BeautifulSoup
+        page: _PageIndex
     ) -> FormField:
         """Create FormField from a select element."""
         name = select.get('name', '')
         select_id = select.get('id')
         
         # Find associated label
-        label = None
-        if select_id:
-            label_elem = soup.find('label', attrs={'for': select_id})
-            if label_elem:
-                label = label_elem.get_text(strip=True)
+        label = page.label_text(select_id)
         
         # Get options
         options = []
@@ -258,25 +606,20 @@ class FormAnalyzer:
             label=label,
             required=select.has_attr('required'),
             options=options,
-            aria_label=select.get('aria-label'),
-            html=str(select)
+            aria_label=select.get('aria-label')
         )
     
     def _create_field_from_textarea(
         self,
         textarea: Tag,
-        soup: BeautifulSoup
+        page: _PageIndex
     ) -> FormField:
         """Create FormField from a textarea element."""
         name = textarea.get('name', '')
         textarea_id = textarea.get('id')
         
         # Find associated label
-        label = None
-        if textarea_id:
-            label_elem = soup.find('label', attrs={'for': textarea_id})
-            if label_elem:
-                label = label_elem.get_text(strip=True)
+        label = page.label_text(textarea_id)
         
         return FormField(
             name=name,
@@ -287,8 +630,7 @@ class FormAnalyzer:
             min_length=self._parse_int(textarea.get('minlength')),
             max_length=self._parse_int(textarea.get('maxlength')),
             default_value=textarea.get_text(),
-            aria_label=textarea.get('aria-label'),
-            html=str(textarea)
+            aria_label=textarea.get('aria-label')
         )
     
     def _parse_int(self, value: Optional[str]) -> Optional[int]:
@@ -302,52 +644,11 @@ class FormAnalyzer:
     
     def _determine_form_type(self, form_info: FormInfo) -> str:
         """Determine the type of form based on its fields."""
-        field_names = [f.name.lower() for f in form_info.fields if f.name]
-        field_types = [f.field_type for f in form_info.fields]
-        
-        # Check for login form
-        has_password = 'password' in field_types
-        has_email = 'email' in field_types or any('email' in n for n in field_names)
-        has_username = any(n in field_names for n in ['username', 'user', 'login'])
-        
-        if has_password and (has_email or has_username) and len(form_info.fields) <= 3:
-            return 'login'
-        
-        # Check for registration form
-        if has_password and has_email and len(form_info.fields) > 3:
-            confirm_password = any('confirm' in n or 'repeat' in n for n in field_names)
-            if confirm_password:
-                return 'registration'
-        
-        # Check for search form
-        if len(form_info.fields) == 1:
-            if 'search' in field_types or any('search' in n or 'q' == n for n in field_names):
-                return 'search'
-        
-        # Check for contact form
-        contact_indicators = ['message', 'comment', 'body', 'content', 'subject']
-        has_message = any(n in field_names for n in contact_indicators)
-        has_textarea = 'textarea' in field_types
-        
-        if has_email and (has_message or has_textarea):
-            return 'contact'
-        
-        # Check for newsletter/subscribe form
-        if has_email and len(form_info.fields) <= 2:
-            return 'newsletter'
-        
-        # Check for checkout/payment form
-        payment_indicators = ['card', 'credit', 'payment', 'cvv', 'expiry']
-        if any(any(ind in n for ind in payment_indicators) for n in field_names):
-            return 'payment'
-        
-        # Check for address form
-        address_indicators = ['address', 'street', 'city', 'zip', 'postal', 'country', 'state']
-        address_matches = sum(1 for n in field_names if any(ind in n for ind in address_indicators))
-        if address_matches >= 3:
-            return 'address'
-        
-        return 'other'
+        # The classification only looks at which names and types occur
+        # (and how often names do), so repeated forms share one entry
+        field_names = tuple(sorted(f.name.lower() for f in form_info.fields if f.name))
+        field_types = frozenset(f.field_type for f in form_info.fields)
+        return _classify_form(field_names, field_types, len(form_info.fields))
     
     def generate_form_html(self, form_info: FormInfo) -> str:
         """
@@ -375,9 +676,14 @@ class FormAnalyzer:
         
         lines.append(f'<form {" ".join(attrs)}>')
         
-        # Fields
+        # Fields are written straight into the form's lines, so the
+        # whole form is joined once rather than once per field
         for fld in form_info.fields:
-            lines.append(self._generate_field_html(fld))
+            start = len(lines)
+            self._emit_field_html(fld, lines)
+            if len(lines) == start:
+                # A field with nothing to show still left a blank line
+                lines.append('')
         
         # Submit button
         if form_info.submit_button:
@@ -390,8 +696,12 @@ class FormAnalyzer:
     
     def _generate_field_html(self, fld: FormField) -> str:
         """Generate HTML for a form field."""
-        lines = []
-        
+        lines: List[str] = []
+        self._emit_field_html(fld, lines)
+        return '\n'.join(lines)
+    
+    def _emit_field_html(self, fld: FormField, lines: List[str]) -> None:
+        """Append the HTML lines for a form field to lines."""
         # Label
         field_id = fld.name.replace(' ', '_')
         if fld.label:
@@ -436,5 +746,8 @@ class FormAnalyzer:
             if fld.default_value:
                 attrs.append(f'value="{fld.default_value}"')
             lines.append(f'  <input {" ".join(attrs)}>')
-        
-        return '\n'.join(lines)
+
+
+def _analyze_one_html(html: str) -> FormAnalysisResult:
+    """Worker for FormAnalyzer.analyze_many (module level to be picklable)."""
+    return FormAnalyzer().analyze(html)
@@ -4,16 +4,24 @@ Performance analyzer module for capturing performance metrics.
 Extracts performance-related information from web pages.
 """
 
+import os
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 from bs4 import BeautifulSoup
 
+from ..utils.cache import ResultCache, content_key
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.log import get_logger
+from ..utils.markup import scan_html, reject_namespaced
 
+# Font file URLs referenced from inline CSS; the extension group does not
+# capture, so findall() returns the URLs themselves
+_FONT_URL_RE = re.compile(r'url\(["\']?([^"\')\s]+\.(?:woff2?|ttf|otf|eot))["\']?\)')
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ResourceInfo:
     """Information about a resource."""
     url: str
@@ -26,7 +34,7 @@ class ResourceInfo:
     preload: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PerformanceHints:
     """Performance optimization hints."""
     critical_css: List[str] = field(default_factory=list)
@@ -35,7 +43,7 @@ class PerformanceHints:
     optimization_suggestions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PerformanceResult:
     """Result of performance analysis."""
     # Resource counts
@@ -66,6 +74,158 @@ class PerformanceResult:
     score: float = 100.0
 
 
+@dataclass(**DATACLASS_SLOTS)
+class _PageTags:
+    """
+    The tags each part of the analysis reads, in document order.
+    
+    Tags are kept as their attribute dicts, with ``rel`` and ``class``
+    split into lists as BeautifulSoup does; style tags as their
+    BeautifulSoup ``.string``.
+    """
+    scripts: List[Dict[str, Any]] = field(default_factory=list)
+    stylesheets: List[Dict[str, Any]] = field(default_factory=list)
+    images: List[Dict[str, Any]] = field(default_factory=list)
+    styles: List[Optional[str]] = field(default_factory=list)
+    preloads: List[Dict[str, Any]] = field(default_factory=list)
+    font_preloads: List[Dict[str, Any]] = field(default_factory=list)
+    styled_elements: int = 0
+    
+    def add(self, name: str, attrs: Dict[str, Any]) -> None:
+        """File a non-style tag under the groups it belongs to."""
+        if name == 'script':
+            self.scripts.append(attrs)
+        elif name == 'link':
+            rels = _rel_values(attrs)
+            if any('stylesheet' in rel for rel in rels):
+                self.stylesheets.append(attrs)
+            if 'preload' in rels:
+                self.preloads.append(attrs)
+                if attrs.get('as') == 'font':
+                    self.font_preloads.append(attrs)
+        elif name == 'img':
+            self.images.append(attrs)
+        
+        if 'style' in attrs:
+            self.styled_elements += 1
+
+
+def _rel_values(attrs: Dict[str, Any]) -> List[str]:
+    """Return a link's rel tokens (a single string if the parser kept one)."""
+    rel = attrs.get('rel')
+    if rel is None:
+        return []
+    if isinstance(rel, str):
+        return [rel]
+    return rel
+
+
+def _collect_tags(soup: BeautifulSoup) -> _PageTags:
+    """
+    Sort the page's tags into the groups the analysis reads, in one walk.
+    
+    Each group holds the same tags, in the same order, as the find_all()
+    query it replaces (e.g. ``rel='preload'`` matching any rel token).
+    """
+    tags = _PageTags()
+    for tag in soup.find_all(True):
+        if tag.name == 'style':
+            tags.styles.append(tag.string)
+        tags.add(tag.name, tag.attrs)
+    return tags
+
+
+class _ResourceScanner:
+    """
+    lxml parser target that sorts tags the way _collect_tags does.
+    
+    It sees the same parser events BeautifulSoup builds its tree from,
+    so the groups match those read from a soup of the page, without
+    any tree being built.
+    """
+    
+    def __init__(self):
+        self.tags = _PageTags()
+        # Text of the open style tag, or None once it has anything but
+        # text (BeautifulSoup's .string is then None)
+        self._style_text: Optional[List[str]] = None
+        self._in_style = False
+    
+    def start(self, tag: str, attrib: Dict[str, str], nsmap: Any = None) -> None:
+        reject_namespaced(tag, attrib)
+        self._style_text = None
+        
+        if tag == 'style':
+            self._in_style = True
+            self._style_text = []
+            self.tags.styles.append(None)
+        elif tag == 'link' and 'rel' in attrib:
+            attrib['rel'] = attrib['rel'].split()
+        elif tag == 'img' and 'class' in attrib:
+            attrib['class'] = attrib['class'].split()
+        self.tags.add(tag, attrib)
+    
+    def end(self, tag: str) -> None:
+        if tag == 'style' and self._in_style:
+            self._end_style()
+    
+    def _end_style(self) -> None:
+        if self._style_text:
+            self.tags.styles[-1] = ''.join(self._style_text)
+        self._in_style = False
+        self._style_text = None
+    
+    def data(self, data: str) -> None:
+        if self._style_text is not None:
+            self._style_text.append(data)
+    
+    def comment(self, text: str) -> None:
+        self._style_text = None
+    
+    def close(self) -> _PageTags:
+        if self._in_style:
+            self._end_style()
+        return self.tags
+
+
+def _score_kernel(
+    render_blocking: int,
+    async_scripts: int,
+    defer_scripts: int,
+    total_scripts: int,
+    total_images: int,
+    lazy_images: int,
+    inline_scripts: int,
+    inline_styles: int,
+    total_resources: int
+) -> float:
+    """Performance score out of 100, from a page's resource counts."""
+    score = 100.0
+    
+    # Penalize render-blocking resources
+    score -= render_blocking * 3
+    
+    # Reward async/defer usage
+    if total_scripts > 0:
+        score += (async_scripts + defer_scripts) / total_scripts * 10
+    
+    # Reward lazy loading
+    if total_images > 5:
+        score += lazy_images / total_images * 10
+    
+    # Penalize too many inline resources
+    if inline_scripts > 10:
+        score -= 5
+    if inline_styles > 20:
+        score -= 5
+    
+    # Penalize too many total resources
+    if total_resources > 50:
+        score -= (total_resources - 50) * 0.5
+    
+    return max(0, min(100, round(score, 1)))
+
+
 class PerformanceAnalyzer:
     """
     Analyzes performance aspects of web pages.
@@ -73,34 +233,76 @@ class PerformanceAnalyzer:
     Extracts resource information and provides optimization hints.
     """
     
-    def __init__(self):
-        """Initialize the performance analyzer."""
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the performance analyzer.
+        
+        Args:
+            cache_size: Number of results kept for repeated identical
+                pages (0 disables caching)
+        """
         self.logger = get_logger("performance")
+        self._cache = ResultCache(cache_size)
     
-    def analyze(self, html: str) -> PerformanceResult:
+    def analyze(
+        self,
+        html: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
+    ) -> PerformanceResult:
         """
         Analyze performance aspects of HTML content.
         
         Args:
             html: HTML content to analyze
+            soup: Already parsed page, used instead of parsing ``html``
+                (if both are given, ``soup`` must be ``html`` as parsed).
+                Results are cached by ``html``; a soup given without it
+                is analyzed every time.
             
         Returns:
             PerformanceResult with performance information
         """
+        if html is None:
+            if soup is None:
+                raise ValueError("either html or soup is required")
+            return self._analyze(None, soup)
+        
+        key = content_key(html)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._analyze(html, soup)
+            self._cache.put(key, result)
+        return result
+    
+    def _analyze(
+        self,
+        html: Optional[str],
+        soup: Optional[BeautifulSoup]
+    ) -> PerformanceResult:
+        """Analyze ``html`` or ``soup`` without consulting the cache."""
         result = PerformanceResult()
         
-        try:
-            soup = BeautifulSoup(html, 'lxml')
-        except Exception:
-            soup = BeautifulSoup(html, 'html.parser')
+        if soup is not None:
+            tags = _collect_tags(soup)
+        else:
+            # Without a soup to share, the tags are read off lxml's parser
+            # events; a tree is only built for markup lxml rejects
+            try:
+                tags = scan_html(html, _ResourceScanner())
+            except Exception:
+                try:
+                    soup = BeautifulSoup(html, 'lxml')
+                except Exception:
+                    soup = BeautifulSoup(html, 'html.parser')
+                tags = _collect_tags(soup)
         
         # Analyze different resource types
-        self._analyze_scripts(soup, result)
-        self._analyze_stylesheets(soup, result)
-        self._analyze_images(soup, result)
-        self._analyze_fonts(soup, result)
-        self._analyze_preloads(soup, result)
-        self._analyze_inline_resources(soup, result)
+        self._analyze_scripts(tags, result)
+        self._analyze_stylesheets(tags, result)
+        self._analyze_images(tags, result)
+        self._analyze_fonts(tags, result)
+        self._analyze_preloads(tags, result)
+        self._analyze_inline_resources(tags, result)
         
         # Generate optimization hints
         result.hints = self._generate_hints(result, soup)
@@ -110,15 +312,35 @@ class PerformanceAnalyzer:
         
         return result
     
+    @classmethod
+    def analyze_many(
+        cls,
+        htmls: Iterable[str],
+        workers: Optional[int] = None
+    ) -> List[PerformanceResult]:
+        """
+        Analyze several pages in parallel worker processes.
+        
+        Args:
+            htmls: HTML content of each page
+            workers: Number of processes (defaults to the CPU count)
+            
+        Returns:
+            PerformanceResult for each page, in input order
+        """
+        # Imported here: multiprocessing is only needed for batches
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(_analyze_one_html, htmls, chunksize=8))
+    
     def _analyze_scripts(
         self,
-        soup: BeautifulSoup,
+        tags: _PageTags,
         result: PerformanceResult
     ) -> None:
         """Analyze script elements."""
-        scripts = soup.find_all('script')
-        
-        for script in scripts:
+        for script in tags.scripts:
             src = script.get('src')
             
             if not src:
@@ -126,8 +348,8 @@ class PerformanceAnalyzer:
                 result.inline_scripts_count += 1
                 continue
             
-            is_async = script.has_attr('async')
-            is_defer = script.has_attr('defer')
+            is_async = 'async' in script
+            is_defer = 'defer' in script
             is_module = script.get('type') == 'module'
             
             # Render blocking if not async, defer, or module
@@ -154,14 +376,12 @@ class PerformanceAnalyzer:
     
     def _analyze_stylesheets(
         self,
-        soup: BeautifulSoup,
+        tags: _PageTags,
         result: PerformanceResult
     ) -> None:
         """Analyze stylesheet elements."""
         # Link stylesheets
-        links = soup.find_all('link', rel=lambda x: x and 'stylesheet' in str(x))
-        
-        for link in links:
+        for link in tags.stylesheets:
             href = link.get('href')
             if not href:
                 continue
@@ -186,21 +406,19 @@ class PerformanceAnalyzer:
     
     def _analyze_images(
         self,
-        soup: BeautifulSoup,
+        tags: _PageTags,
         result: PerformanceResult
     ) -> None:
         """Analyze image elements."""
-        images = soup.find_all('img')
-        
-        for img in images:
+        for img in tags.images:
             src = img.get('src', '') or img.get('data-src', '')
             if not src or src.startswith('data:'):
                 continue
             
             # Check for lazy loading
             loading = img.get('loading', '')
-            has_lazy_class = 'lazy' in ' '.join(img.get('class', []))
-            is_lazy = loading == 'lazy' or img.has_attr('data-src') or has_lazy_class
+            has_lazy_class = any('lazy' in name for name in img.get('class') or ())
+            is_lazy = loading == 'lazy' or 'data-src' in img or has_lazy_class
             
             resource = ResourceInfo(
                 url=src,
@@ -217,16 +435,19 @@ class PerformanceAnalyzer:
     
     def _analyze_fonts(
         self,
-        soup: BeautifulSoup,
+        tags: _PageTags,
         result: PerformanceResult
     ) -> None:
         """Analyze font resources."""
-        # Preload fonts
-        preload_fonts = soup.find_all('link', rel='preload', attrs={'as': 'font'})
+        # Each font URL is listed once, even when it is preloaded twice or
+        # referenced from several style blocks; a preload wins over CSS
+        seen = set()
         
-        for link in preload_fonts:
+        # Preload fonts
+        for link in tags.font_preloads:
             href = link.get('href')
-            if href:
+            if href and href not in seen:
+                seen.add(href)
                 result.fonts.append(ResourceInfo(
                     url=href,
                     resource_type='font',
@@ -234,12 +455,14 @@ class PerformanceAnalyzer:
                 ))
         
         # Font URLs in CSS (heuristic)
-        for style in soup.find_all('style'):
-            if style.string:
-                font_pattern = re.compile(r'url\(["\']?([^"\')\s]+\.(woff2?|ttf|otf|eot))["\']?\)')
-                for match in font_pattern.finditer(style.string):
+        for css in tags.styles:
+            if css:
+                for url in _FONT_URL_RE.findall(css):
+                    if url in seen:
+                        continue
+                    seen.add(url)
                     result.fonts.append(ResourceInfo(
-                        url=match.group(1),
+                        url=url,
                         resource_type='font',
                         preload=False
                     ))
@@ -248,13 +471,11 @@ class PerformanceAnalyzer:
     
     def _analyze_preloads(
         self,
-        soup: BeautifulSoup,
+        tags: _PageTags,
         result: PerformanceResult
     ) -> None:
         """Analyze preloaded resources."""
-        preloads = soup.find_all('link', rel='preload')
-        
-        for link in preloads:
+        for link in tags.preloads:
             href = link.get('href')
             as_type = link.get('as', 'unknown')
             
@@ -267,22 +488,20 @@ class PerformanceAnalyzer:
     
     def _analyze_inline_resources(
         self,
-        soup: BeautifulSoup,
+        tags: _PageTags,
         result: PerformanceResult
     ) -> None:
         """Analyze inline styles and scripts."""
         # Count inline styles (already counted scripts above)
-        style_tags = soup.find_all('style')
-        result.inline_styles_count = len(style_tags)
+        result.inline_styles_count = len(tags.styles)
         
         # Count inline style attributes
-        elements_with_style = soup.find_all(style=True)
-        result.inline_styles_count += len(elements_with_style)
+        result.inline_styles_count += tags.styled_elements
     
     def _generate_hints(
         self,
         result: PerformanceResult,
-        soup: BeautifulSoup
+        soup: Optional[BeautifulSoup]
     ) -> PerformanceHints:
         """Generate performance optimization hints."""
         hints = PerformanceHints()
@@ -337,38 +556,18 @@ class PerformanceAnalyzer:
     
     def _calculate_score(self, result: PerformanceResult) -> float:
         """Calculate performance score based on analysis."""
-        score = 100.0
-        
-        # Penalize render-blocking resources
-        score -= result.render_blocking_resources * 3
-        
-        # Reward async/defer usage
-        if result.total_scripts > 0:
-            async_ratio = (result.async_scripts + result.defer_scripts) / result.total_scripts
-            score += async_ratio * 10
-        
-        # Reward lazy loading
-        if result.total_images > 5:
-            lazy_ratio = result.lazy_loaded_images / result.total_images
-            score += lazy_ratio * 10
-        
-        # Penalize too many inline resources
-        if result.inline_scripts_count > 10:
-            score -= 5
-        if result.inline_styles_count > 20:
-            score -= 5
-        
-        # Penalize too many total resources
-        total_resources = (
-            result.total_scripts +
-            result.total_stylesheets +
-            result.total_images +
-            result.total_fonts
+        return _score_kernel(
+            result.render_blocking_resources,
+            result.async_scripts,
+            result.defer_scripts,
+            result.total_scripts,
+            result.total_images,
+            result.lazy_loaded_images,
+            result.inline_scripts_count,
+            result.inline_styles_count,
+            result.total_scripts + result.total_stylesheets +
+            result.total_images + result.total_fonts,
         )
-        if total_resources > 50:
-            score -= (total_resources - 50) * 0.5
-        
-        return max(0, min(100, round(score, 1)))
     
     def generate_performance_report(self, result: PerformanceResult) -> str:
         """
@@ -424,3 +623,8 @@ class PerformanceAnalyzer:
         lines.append("=" * 60)
         
         return '\n'.join(lines)
+
+
+def _analyze_one_html(html: str) -> PerformanceResult:
+    """Worker for PerformanceAnalyzer.analyze_many (module level to be picklable)."""
+    return PerformanceAnalyzer().analyze(html)
@@ -6,14 +6,32 @@ Captures screenshots at multiple viewport sizes and full-page screenshots.
 
 import os
 import asyncio
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
-from playwright.async_api import Page
+# Playwright is only needed for type hints here; the page objects are
+# created by the caller, so avoid importing it at module load.
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+# Pillow is optional; without it thumbnails are captured by the browser
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 from ..utils.log import get_logger
 from ..utils.paths import ensure_dir
 
+# File extension for each screenshot format Playwright can write
+_IMAGE_EXTENSIONS = {"jpeg": ".jpg", "png": ".png"}
+
+# Seconds to let a page re-lay out after its viewport is resized, so
+# debounced resize handlers, CSS transitions and srcset swaps finish
+_REFLOW_DELAY = 0.5
+_THUMBNAIL_REFLOW_DELAY = 0.3
+
 
 @dataclass
 class ViewportSize:
@@ -63,7 +81,11 @@ class ScreenshotCapture:
         viewports: Optional[List[str]] = None,
         full_page: bool = True,
         generate_thumbnails: bool = True,
-        thumbnail_width: int = 300
+        thumbnail_width: int = 300,
+        max_parallel_pages: int = 1,
+        navigation_timeout: int = 30000,
+        image_format: str = "jpeg",
+        image_quality: int = 85
     ):
         """
         Initialize screenshot capture.
@@ -74,12 +96,32 @@ class ScreenshotCapture:
             full_page: Whether to capture full-page screenshots
             generate_thumbnails: Whether to generate thumbnail images
             thumbnail_width: Width of thumbnail images
+            max_parallel_pages: Most extra tabs open at once while
+                capturing the viewports of one page; 1 (the default)
+                captures every viewport on the rendered page itself,
+                see capture_page()
+            navigation_timeout: Page load timeout for those tabs in
+                milliseconds
+            image_format: Screenshot format, "jpeg" or "png"; the
+                browser encodes JPEG far faster than PNG
+            image_quality: JPEG quality (0-100), ignored for PNG
+        
+        Raises:
+            ValueError: If image_format is not supported
         """
+        if image_format not in _IMAGE_EXTENSIONS:
+            raise ValueError(f"unsupported screenshot format: {image_format!r}")
+        
         self.output_dir = output_dir
         self.screenshots_dir = os.path.join(output_dir, "screenshots")
         self.full_page = full_page
         self.generate_thumbnails = generate_thumbnails
         self.thumbnail_width = thumbnail_width
+        self.max_parallel_pages = max(1, max_parallel_pages)
+        self.navigation_timeout = navigation_timeout
+        self.image_format = image_format
+        self.image_quality = image_quality
+        self._extension = _IMAGE_EXTENSIONS[image_format]
         self.logger = get_logger("screenshot")
         
         # Default to common viewports if not specified
@@ -103,13 +145,27 @@ class ScreenshotCapture:
     
     async def capture_page(
         self,
-        page: Page,
+        page: "Page",
         url: str,
         filename_base: str
     ) -> ScreenshotResult:
         """
         Capture screenshots of a page at all configured viewports.
         
+        By default every viewport is captured on ``page`` itself, one
+        after another, so the screenshots show the DOM the caller
+        rendered and analyzed.
+        
+        With ``max_parallel_pages`` above 1, only the first viewport is
+        captured on ``page``; the others load the page again in tabs of
+        its browser context, opened with their viewport size and
+        captured concurrently (at most ``max_parallel_pages`` at a
+        time). That is faster, but those screenshots are of fresh loads:
+        client-side state, scroll position and content injected after
+        the crawler's render are not carried over, and the site is
+        fetched once more per extra viewport, outside the crawler's
+        crawl delay and robots.txt throttling.
+        
         Args:
             page: Playwright page object
             url: URL of the page
@@ -124,15 +180,39 @@ class ScreenshotCapture:
         safe_filename = self._sanitize_filename(filename_base)
         
         # Capture at each viewport
-        for viewport in self.viewports:
-            try:
-                screenshot_path = await self._capture_viewport(
-                    page, viewport, safe_filename
-                )
-                result.screenshots[viewport.name] = screenshot_path
-            except Exception as e:
-                self.logger.error(f"Error capturing {viewport.name}: {e}")
-                result.errors.append(f"{viewport.name}: {str(e)}")
+        if self.max_parallel_pages <= 1:
+            for viewport in self.viewports:
+                try:
+                    screenshot_path = await self._capture_viewport(
+                        page, viewport, safe_filename
+                    )
+                    result.screenshots[viewport.name] = screenshot_path
+                except Exception as e:
+                    self.logger.error(f"Error capturing {viewport.name}: {e}")
+                    result.errors.append(f"{viewport.name}: {str(e)}")
+        elif self.viewports:
+            first, *others = self.viewports
+            page_url = page.url or url
+            semaphore = asyncio.Semaphore(self.max_parallel_pages)
+            outcomes = await asyncio.gather(
+                self._capture_viewport(page, first, safe_filename),
+                *(
+                    self._capture_viewport_in_new_page(
+                        page.context, page_url, viewport, safe_filename, semaphore
+                    )
+                    for viewport in others
+                ),
+                return_exceptions=True
+            )
+            
+            for viewport, outcome in zip(self.viewports, outcomes):
+                if isinstance(outcome, Exception):
+                    self.logger.error(f"Error capturing {viewport.name}: {outcome}")
+                    result.errors.append(f"{viewport.name}: {str(outcome)}")
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    result.screenshots[viewport.name] = outcome
         
         # Capture full page at desktop viewport
         if self.full_page:
@@ -148,7 +228,7 @@ class ScreenshotCapture:
         if self.generate_thumbnails and result.screenshots.get("desktop"):
             try:
                 result.thumbnail_path = await self._generate_thumbnail(
-                    page, safe_filename
+                    page, safe_filename, result.screenshots["desktop"]
                 )
             except Exception as e:
                 self.logger.debug(f"Error generating thumbnail: {e}")
@@ -157,7 +237,7 @@ class ScreenshotCapture:
     
     async def _capture_viewport(
         self,
-        page: Page,
+        page: "Page",
         viewport: ViewportSize,
         filename_base: str
     ) -> str:
@@ -169,18 +249,52 @@ class ScreenshotCapture:
         })
         
         # Wait for content to reflow
-        await asyncio.sleep(0.5)
+        await self._settle()
         
-        # Capture screenshot
+        return await self._save_viewport(page, viewport, filename_base)
+    
+    async def _capture_viewport_in_new_page(
+        self,
+        context: "BrowserContext",
+        url: str,
+        viewport: ViewportSize,
+        filename_base: str,
+        semaphore: asyncio.Semaphore
+    ) -> str:
+        """Load ``url`` in a new tab sized for ``viewport`` and capture it."""
+        async with semaphore:
+            page = await context.new_page()
+            try:
+                # Sized before loading, so the page lays out only once
+                await page.set_viewport_size({
+                    "width": viewport.width,
+                    "height": viewport.height
+                })
+                await page.goto(
+                    url,
+                    wait_until="networkidle",
+                    timeout=self.navigation_timeout
+                )
+                return await self._save_viewport(page, viewport, filename_base)
+            finally:
+                await page.close()
+    
+    async def _save_viewport(
+        self,
+        page: "Page",
+        viewport: ViewportSize,
+        filename_base: str
+    ) -> str:
+        """Screenshot the visible part of ``page`` into the viewport's folder."""
         filepath = os.path.join(
             self.screenshots_dir,
             viewport.name,
-            f"{filename_base}.png"
+            f"{filename_base}{self._extension}"
         )
         
         await page.screenshot(
             path=filepath,
-            type="png",
+            **self._image_options(),
             full_page=False
         )
         
@@ -189,23 +303,23 @@ class ScreenshotCapture:
     
     async def _capture_full_page(
         self,
-        page: Page,
+        page: "Page",
         filename_base: str
     ) -> str:
         """Capture full-page screenshot."""
         # Set to desktop viewport for full page
         await page.set_viewport_size({"width": 1920, "height": 1080})
-        await asyncio.sleep(0.5)
+        await self._settle()
         
         filepath = os.path.join(
             self.screenshots_dir,
             "full_page",
-            f"{filename_base}_full.png"
+            f"{filename_base}_full{self._extension}"
         )
         
         await page.screenshot(
             path=filepath,
-            type="png",
+            **self._image_options(),
             full_page=True
         )
         
@@ -214,29 +328,74 @@ class ScreenshotCapture:
     
     async def _generate_thumbnail(
         self,
-        page: Page,
-        filename_base: str
+        page: "Page",
+        filename_base: str,
+        desktop_path: Optional[str] = None
     ) -> str:
-        """Generate a small thumbnail image."""
+        """
+        Generate a small thumbnail image.
+        
+        With Pillow installed the desktop screenshot is scaled down to
+        ``thumbnail_width`` (pillow-simd, a drop-in replacement, does
+        this faster still); otherwise the browser captures the top of
+        the page again.
+        """
         filepath = os.path.join(
             self.screenshots_dir,
             "thumbnails",
-            f"{filename_base}_thumb.png"
+            f"{filename_base}_thumb{self._extension}"
         )
         
+        if PIL_AVAILABLE and desktop_path:
+            # Decoding and resizing block, so they run off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, self._downsample, desktop_path, filepath
+            )
+            return filepath
+        
         # Set to a reasonable viewport
         await page.set_viewport_size({"width": 1200, "height": 800})
-        await asyncio.sleep(0.3)
+        await self._settle(_THUMBNAIL_REFLOW_DELAY)
         
         # Capture and let Playwright handle the clipping
         await page.screenshot(
             path=filepath,
-            type="png",
+            **self._image_options(),
             clip={"x": 0, "y": 0, "width": 1200, "height": 800}
         )
         
         return filepath
     
+    def _downsample(self, source_path: str, filepath: str) -> None:
+        """Write a copy of an image scaled to ``thumbnail_width`` wide."""
+        resample = getattr(Image, "Resampling", Image).LANCZOS
+        with Image.open(source_path) as image:
+            # thumbnail() keeps the aspect ratio, so only the width bounds it
+            image.thumbnail((self.thumbnail_width, image.height), resample)
+            if self.image_format == "jpeg":
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                image.save(filepath, "JPEG", quality=self.image_quality, optimize=True)
+            else:
+                image.save(filepath, "PNG")
+    
+    def _image_options(self) -> Dict[str, Any]:
+        """Keyword arguments selecting the screenshot format for Playwright."""
+        if self.image_format == "jpeg":
+            return {"type": "jpeg", "quality": self.image_quality}
+        return {"type": "png"}
+    
+    async def _settle(self, delay: float = _REFLOW_DELAY) -> None:
+        """
+        Wait a fixed, short time after a viewport change.
+        
+        The page's load state can't be used: it stays "networkidle" once
+        the renderer has loaded the page, so waiting for it returns at
+        once, while resize handlers and transitions are still running.
+        """
+        await asyncio.sleep(delay)
+    
     def _sanitize_filename(self, filename: str) -> str:
         """Convert URL or name to safe filename."""
         import re
@@ -250,7 +409,7 @@ class ScreenshotCapture:
     
     async def capture_element(
         self,
-        page: Page,
+        page: "Page",
         selector: str,
         filename: str
     ) -> Optional[str]:
@@ -273,11 +432,11 @@ class ScreenshotCapture:
             filepath = os.path.join(
                 self.screenshots_dir,
                 "elements",
-                f"{filename}.png"
+                f"{filename}{self._extension}"
             )
             ensure_dir(os.path.dirname(filepath))
             
-            await element.screenshot(path=filepath)
+            await element.screenshot(path=filepath, **self._image_options())
             return filepath
             
         except Exception as e:
@@ -8,9 +8,12 @@ import os
 import json
 import asyncio
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
-from playwright.async_api import Page
+if TYPE_CHECKING:  # annotation only, see screenshot.py
+    from playwright.async_api import Page
+
+from bs4 import BeautifulSoup
 
 from .screenshot import ScreenshotCapture, ScreenshotResult
 from .styles import StyleAnalyzer, StyleAnalysisResult
@@ -120,7 +123,7 @@ class UIExtractor:
     
     async def extract(
         self,
-        page: Page,
+        page: "Page",
         url: str,
         html: str,
         css_content: str = ""
@@ -198,10 +201,22 @@ class UIExtractor:
                 self.logger.error(f"SEO extraction failed: {e}")
                 result.errors.append(f"SEO: {str(e)}")
         
+        # Forms and performance read the same tree, so the page is parsed
+        # once for both; if parsing fails each analyzer reports it itself
+        soup = None
+        if self._analyze_forms or self._analyze_performance:
+            try:
+                soup = BeautifulSoup(html, 'lxml')
+            except Exception:
+                try:
+                    soup = BeautifulSoup(html, 'html.parser')
+                except Exception:
+                    soup = None
+        
         # Analyze forms
         if self._analyze_forms:
             try:
-                result.forms = self.form_analyzer.analyze(html)
+                result.forms = self.form_analyzer.analyze(html, soup=soup)
             except Exception as e:
                 self.logger.error(f"Form analysis failed: {e}")
                 result.errors.append(f"Forms: {str(e)}")
@@ -209,7 +224,7 @@ class UIExtractor:
         # Analyze performance
         if self._analyze_performance:
             try:
-                result.performance = self.performance_analyzer.analyze(html)
+                result.performance = self.performance_analyzer.analyze(html, soup=soup)
             except Exception as e:
                 self.logger.error(f"Performance analysis failed: {e}")
                 result.errors.append(f"Performance: {str(e)}")
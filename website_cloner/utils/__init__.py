@@ -1,12 +1,18 @@
 """
 Utility modules for website cloning.
 
-Contains logging, path handling, robots.txt parsing utilities, and constants.
+Contains logging, path handling, robots.txt parsing, result caching
+and regex utilities, and constants. The lxml-based HTML scanning
+helpers in utils.markup are imported from that module directly, so
+importing this package does not load lxml.
 """
 
 from .log import setup_logger, get_logger
 from .paths import normalize_url, get_asset_path, ensure_dir
 from .robots import RobotsHandler
+from .cache import ResultCache, content_key
+from .patterns import trie_pattern
+from .compat import DATACLASS_SLOTS
 from .constants import (
     DEFAULT_USER_AGENT,
     DEFAULT_TIMEOUT,
@@ -24,6 +30,10 @@ __all__ = [
     "get_asset_path",
     "ensure_dir",
     "RobotsHandler",
+    "ResultCache",
+    "content_key",
+    "trie_pattern",
+    "DATACLASS_SLOTS",
     "DEFAULT_USER_AGENT",
     "DEFAULT_TIMEOUT",
     "DEFAULT_PAGE_TIMEOUT",
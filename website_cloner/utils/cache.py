@@ -0,0 +1,80 @@
+"""
+Result caching utilities for the website cloner.
+
+Provides a small bounded LRU cache used by the analyzers to skip
+re-analysing identical page content.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def content_key(*parts: str) -> bytes:
+    """
+    Build a cache key from one or more strings.
+
+    Args:
+        parts: Content the cached result depends on (e.g. HTML and CSS)
+
+    Returns:
+        16-byte BLAKE2b digest of the parts
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = (part or "").encode('utf-8', 'surrogatepass')
+        # Length prefix keeps ("ab", "c") and ("a", "bc") apart
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.digest()
+
+
+class ResultCache:
+    """
+    Bounded, thread-safe LRU cache of analysis results.
+
+    Values are deep-copied on the way in and out, so callers can freely
+    mutate the results they get back without corrupting the cache.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept; 0 disables caching
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return a copy of the cached value for ``key``, or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                return None
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Store a copy of ``value`` under ``key``, evicting the oldest entry."""
+        if self.maxsize <= 0:
+            return
+
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
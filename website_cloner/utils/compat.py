@@ -0,0 +1,12 @@
+"""
+Python version compatibility helpers for the website cloner.
+
+Provides feature flags for language features newer than the minimum
+supported Python version.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; on older versions the
+# dataclasses simply keep their __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
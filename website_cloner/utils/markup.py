@@ -0,0 +1,93 @@
+"""
+HTML scanning helpers for the website cloner.
+
+Runs lxml's HTML parser with a parser target instead of building a
+tree, fed the same way BeautifulSoup feeds it, so a target sees the
+events a soup of the page would be built from.
+"""
+
+from typing import Any, Callable, Dict
+
+from lxml import etree
+
+# BeautifulSoup feeds lxml in chunks of this many characters
+_FEED_CHUNK_SIZE = 512
+
+
+def scan_html(html: str, target: Any) -> Any:
+    """
+    Parse HTML with lxml, reporting it to a parser target.
+    
+    Args:
+        html: HTML content to scan
+        target: lxml parser target (start/end/data/... methods and close)
+    
+    Returns:
+        Whatever the target's close() returns
+    
+    Raises:
+        Whatever lxml or the target raise for markup they reject
+    """
+    # BeautifulSoup drops a leading byte order mark before parsing
+    if html[:1] == '\ufeff':
+        html = html[1:]
+    
+    parser = etree.HTMLParser(target=target, recover=True)
+    parser.feed(html[:_FEED_CHUNK_SIZE])
+    for offset in range(_FEED_CHUNK_SIZE, len(html), _FEED_CHUNK_SIZE):
+        parser.feed(html[offset:offset + _FEED_CHUNK_SIZE])
+    return parser.close()
+
+
+def reject_namespaced(tag: str, attrib: Dict[str, str]) -> None:
+    """
+    Raise ValueError for a tag or attribute name in lxml's '{ns}name' form.
+    
+    BeautifulSoup reads such names differently, so a target mirroring a
+    soup raises here and the caller falls back to the soup.
+    """
+    if tag[0] == '{' or any(name[0] == '{' for name in attrib):
+        raise ValueError(f"namespaced name in <{tag}>")
+
+
+# Passed to a LazyField to have its value computed on first access
+UNREAD: Any = object()
+
+_NO_DEFAULT: Any = object()
+
+
+class LazyField:
+    """
+    Dataclass field default whose value is computed on first access.
+    
+    Declared as ``name: str = LazyField(compute)``, the field stays an
+    ordinary constructor argument (required unless ``default`` is given)
+    and shows up in repr, comparisons and asdict(). A value passed to
+    the constructor is kept as is; ``UNREAD`` leaves it to
+    ``compute(instance)``, run once and cached in the instance __dict__.
+    """
+    
+    def __init__(self, compute: Callable[[Any], Any], default: Any = _NO_DEFAULT):
+        self._compute = compute
+        self._default = default
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+    
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            # Read by @dataclass for the field's default
+            if self._default is _NO_DEFAULT:
+                raise AttributeError(self._name)
+            return self._default
+        try:
+            return instance.__dict__[self._name]
+        except KeyError:
+            value = instance.__dict__[self._name] = self._compute(instance)
+            return value
+    
+    def __set__(self, instance: Any, value: Any) -> None:
+        if value is UNREAD:
+            instance.__dict__.pop(self._name, None)
+        else:
+            instance.__dict__[self._name] = value
@@ -0,0 +1,48 @@
+"""
+Regular expression helpers for the website cloner.
+
+Builds patterns shared by the analyzers for matching many literal
+words at once.
+"""
+
+import re
+from typing import Dict, List
+
+
+def trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex alternation over words, factored by common prefix.
+    
+    A flat ``a|b|c`` alternation retries every word at every position;
+    the prefix tree lets the engine rule out most names after one or two
+    characters, much like a multi-pattern automaton.
+    
+    Args:
+        words: Words the pattern should match
+        
+    Returns:
+        Pattern source matching any of the words, to be anchored by the
+        caller
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(ch) + emit(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ''
+        word_ends_here = '' in node
+        if len(branches) == 1 and not word_ends_here:
+            return branches[0]
+        alternation = '(?:' + '|'.join(branches) + ')'
+        return alternation + '?' if word_ends_here else alternation
+    
+    return emit(trie)